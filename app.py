@@ -1,21 +1,35 @@
 import os
 import time
-import json
+import atexit
+import copy
+import hashlib
+import html
+import fcntl
 import logging
-import subprocess
 import re
+import sqlite3
+import string
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 from datetime import datetime
-from io import BytesIO
+from functools import lru_cache
+from io import BytesIO, StringIO
+from types import SimpleNamespace
 
-from flask import Flask, render_template, request, jsonify, send_file, abort, url_for
+from flask import Flask, Request, Response, render_template, request, jsonify, send_file, abort, url_for
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.utils import secure_filename
 
-from openai import OpenAI
+import httpx
+from openai import OpenAI, DefaultHttpxClient
+import orjson
+import tiktoken
+import zstandard
 
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, ListFlowable, ListItem
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.lib.units import inch
+import batch
 
 
 # ----------------------------
@@ -24,13 +38,61 @@ from reportlab.lib.units import inch
 UPLOAD_FOLDER = "uploads"
 TRANSCRIPT_FOLDER = "transcripts"
 LOG_FOLDER = "logs"
+TRANSCRIPT_CACHE_FOLDER = os.path.join(TRANSCRIPT_FOLDER, "cache")
+LLM_CACHE_FOLDER = os.path.join(LOG_FOLDER, "llm_cache")
 
 MAX_FILE_AGE_SECONDS = 60 * 60  # 1 hour
+JANITOR_INTERVAL_SECONDS = MAX_FILE_AGE_SECONDS / 6
+# Meetings queued through the Batch API wait up to its 24h window for a
+# summary, then get the usual hour to be downloaded.
+BATCH_MEETING_RETENTION_SECONDS = 24 * 60 * 60 + MAX_FILE_AGE_SECONDS
 MAX_CONTENT_LENGTH = 25 * 1024 * 1024  # 25 MB
+TRANSCRIPT_CACHE_MAX_ENTRIES = 256  # least recently used transcripts are evicted
+TRANSCRIPT_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60  # unused for 7 days -> removed by the janitor
+LLM_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60  # 7 days
+# Optional L2 semantic cache for near-duplicate transcripts (needs redisvl)
+REDIS_URL = os.environ.get("REDIS_URL", "")
+# Only near-identical openings count, and only within the same day: a
+# recurring meeting with the same agenda opens much the same every week
+SEMANTIC_CACHE_DISTANCE_THRESHOLD = 0.03
+SEMANTIC_CACHE_PROMPT_CHARS = 4000
+
+SUMMARY_MODEL = "gpt-4o-mini"
+# Transcripts up to this size are summarized in one call; longer ones are
+# map-reduced in parallel chunks, since a single call's latency grows with
+# prompt length.
+SUMMARY_SINGLE_CALL_MAX_TOKENS = 8000
+SUMMARY_CHUNK_TOKENS = 6000
+SUMMARY_CHUNK_OVERLAP_TOKENS = 200
+OPENAI_MAX_CONCURRENCY = int(os.environ.get("OPENAI_MAX_CONCURRENCY", "8"))
+# /process uploads being transcribed + summarized in the background at once
+PROCESS_JOB_WORKERS = int(os.environ.get("PROCESS_JOB_WORKERS", "4"))
+# A job still "queued"/"processing" after this long lost its worker (a
+# restart or crash); longer than Whisper's timeout with all its retries.
+MEETING_JOB_STALE_SECONDS = 30 * 60
+# Connection pool for the shared OpenAI client; keep-alive connections are
+# reused across requests so only the first call pays the TLS handshake.
+OPENAI_MAX_CONNECTIONS = 32
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = 16
+# Per-call timeout and retry budget; the SDK retries connection errors,
+# 408/409/429 and 5xx with exponential backoff.
+OPENAI_TIMEOUT_SECONDS = 30
+OPENAI_CONNECT_TIMEOUT_SECONDS = 5
+# Calls allowed thousands of output tokens (translations, the memo) can
+# take well over a minute to finish generating.
+OPENAI_LONG_TIMEOUT_SECONDS = 180
+OPENAI_MAX_RETRIES = 3
+# Immediate re-attempts of a failed TCP/TLS connect inside the transport,
+# before the SDK's backoff-and-retry kicks in.
+OPENAI_CONNECT_RETRIES = 2
+# Uploading + transcribing a long recording takes far longer than a chat call
+WHISPER_TIMEOUT_SECONDS = 300
 
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 os.makedirs(TRANSCRIPT_FOLDER, exist_ok=True)
 os.makedirs(LOG_FOLDER, exist_ok=True)
+os.makedirs(TRANSCRIPT_CACHE_FOLDER, exist_ok=True)
+os.makedirs(LLM_CACHE_FOLDER, exist_ok=True)
 
 # ----------------------------
 # Logging
@@ -48,70 +110,394 @@ logger = logging.getLogger(__name__)
 # ----------------------------
 # Flask + OpenAI client
 # ----------------------------
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class DiskSpooledRequest(Request):
+    """
+    Spool multipart file parts straight to an unnamed temp file instead of
+    Werkzeug's default of buffering uploads under 500 KB in memory, so RAM
+    use per upload stays flat regardless of size.
+    """
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return tempfile.TemporaryFile("wb+")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    jsonify / request.get_json through orjson: /status and /process_stream
+    responses carry whole transcripts. Types orjson doesn't know (Decimal,
+    objects with __html__) still go through Flask's default hook.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+app.request_class = DiskSpooledRequest
 app.config["UPLOAD_FOLDER"] = UPLOAD_FOLDER
 app.config["MAX_CONTENT_LENGTH"] = MAX_CONTENT_LENGTH
+# Only the agenda is sent as a non-file form field
+app.config["MAX_FORM_MEMORY_SIZE"] = 64 * 1024
+# Uploaded audio is streamed to Whisper; set SAVE_UPLOADS=1 to also keep a copy
+# in UPLOAD_FOLDER for debugging (removed by cleanup_old_files).
+app.config["SAVE_UPLOADS"] = os.environ.get("SAVE_UPLOADS") == "1"
+
 
-client = OpenAI()  # reads OPENAI_API_KEY from environment
+@lru_cache(maxsize=1)
+def _client() -> OpenAI:
+    """
+    The shared OpenAI client, created on first use rather than at import so
+    forking a worker doesn't pay for building it and its connection pool.
+    Reads OPENAI_API_KEY from the environment.
+    """
+    # HTTP/2 multiplexes concurrent calls (chunk summaries, translations)
+    # over one TLS connection. Pool limits live on the transport, since an
+    # explicit transport overrides the client's own.
+    transport = httpx.HTTPTransport(
+        http2=True,
+        retries=OPENAI_CONNECT_RETRIES,
+        limits=httpx.Limits(
+            max_connections=OPENAI_MAX_CONNECTIONS,
+            max_keepalive_connections=OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+        ),
+    )
+    client = OpenAI(
+        http_client=DefaultHttpxClient(
+            transport=transport,
+            timeout=httpx.Timeout(OPENAI_TIMEOUT_SECONDS, connect=OPENAI_CONNECT_TIMEOUT_SECONDS),
+        ),
+        max_retries=OPENAI_MAX_RETRIES,
+    )
+    atexit.register(client.close)
+    return client
+
+
+def _long_output_client() -> OpenAI:
+    """The shared client, with a read timeout for replies of thousands of tokens."""
+    return _client().with_options(
+        timeout=httpx.Timeout(OPENAI_LONG_TIMEOUT_SECONDS, connect=OPENAI_CONNECT_TIMEOUT_SECONDS)
+    )
+
+
+# Shared pool for overlapping independent I/O (disk writes, OpenAI calls)
+# inside a single request. The OpenAI client is safe to share across threads.
+executor = ThreadPoolExecutor(max_workers=OPENAI_MAX_CONCURRENCY + 4, thread_name_prefix="meeting-io")
+# Caps in-flight chat completions across all requests in this process.
+openai_semaphore = threading.BoundedSemaphore(OPENAI_MAX_CONCURRENCY)
+# Background /process jobs. Kept apart from `executor` because a job blocks
+# on futures it submits there; sharing one pool could starve it.
+job_executor = ThreadPoolExecutor(max_workers=PROCESS_JOB_WORKERS, thread_name_prefix="meeting-job")
 
 
 # ----------------------------
 # Housekeeping
 # ----------------------------
-def cleanup_old_files() -> None:
-    """Delete old audio + transcript files."""
-    now = time.time()
-    for folder in (UPLOAD_FOLDER, TRANSCRIPT_FOLDER):
-        if not os.path.isdir(folder):
-            continue
-        for name in os.listdir(folder):
-            path = os.path.join(folder, name)
+def _sweep_folder(folder: str, max_age_seconds: float, now: float) -> int:
+    """
+    Delete files in folder last modified more than max_age_seconds ago.
+
+    Returns:
+        number of files left in place (not yet old enough)
+    """
+    remaining = 0
+    if not os.path.isdir(folder):
+        return remaining
+    # scandir yields d_type with each entry and DirEntry caches its stat,
+    # so each file costs one stat instead of isfile + getmtime.
+    with os.scandir(folder) as it:
+        for entry in it:
             try:
-                if os.path.isfile(path):
-                    age = now - os.path.getmtime(path)
-                    if age > MAX_FILE_AGE_SECONDS:
-                        os.remove(path)
-                        logger.info("Deleted old file: %s", path)
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                if now - entry.stat().st_mtime > max_age_seconds:
+                    os.remove(entry.path)
+                    logger.info("Deleted old file: %s", entry.path)
+                else:
+                    remaining += 1
             except Exception as e:
-                logger.warning("Cleanup error on %s: %s", path, e)
+                remaining += 1
+                logger.warning("Cleanup error on %s: %s", entry.path, e)
+    return remaining
+
+
+def cleanup_old_files() -> int:
+    """
+    Delete old audio + transcript files.
+
+    Returns:
+        number of files left in place (not yet old enough)
+    """
+    now = time.time()
+    return sum(_sweep_folder(folder, MAX_FILE_AGE_SECONDS, now) for folder in (UPLOAD_FOLDER, TRANSCRIPT_FOLDER))
+
+
+def cleanup_cache_folders() -> None:
+    """
+    Expire the LLM result cache and the transcript cache, which would
+    otherwise only drop an entry when that same key is looked up again.
+    A transcript cache entry's mtime is its last use.
+    """
+    now = time.time()
+    _sweep_folder(LLM_CACHE_FOLDER, LLM_CACHE_TTL_SECONDS, now)
+    _sweep_folder(TRANSCRIPT_CACHE_FOLDER, TRANSCRIPT_CACHE_TTL_SECONDS, now)
+
+
+def _folder_mtimes() -> tuple:
+    return tuple(
+        os.stat(folder).st_mtime_ns if os.path.isdir(folder) else 0
+        for folder in (UPLOAD_FOLDER, TRANSCRIPT_FOLDER)
+    )
+
+
+# What the janitor saw last time: how many files it left behind, and the
+# folder mtimes from just before that sweep. A directory's mtime moves on
+# every create/rename/unlink in it -- from any worker process -- so when
+# nothing was left and nothing changed, the sweep can be skipped with two
+# stat calls instead of a full scan.
+_last_sweep = {"remaining": None, "mtimes": None, "caches_at": 0.0}
+# Cache entries live for days, so their folders are swept far less often.
+CACHE_SWEEP_INTERVAL_SECONDS = 60 * 60
+
+
+_janitor_lock_file = None
+# flock is per process; this keeps two janitor threads in one process (e.g.
+# start_janitor called again after a reload) from sweeping at once.
+_cleanup_lock = threading.Lock()
+
+
+def _holds_janitor_lock() -> bool:
+    """
+    Only one process (e.g. one gunicorn worker) sweeps at a time. The first
+    to take an exclusive flock on a sentinel keeps it for its lifetime; the
+    kernel releases it if that process exits, and another worker takes over.
+    """
+    global _janitor_lock_file
+    if _janitor_lock_file is not None:
+        return True
+    fh = open(os.path.join(LOG_FOLDER, "janitor.lock"), "w")
+    try:
+        fcntl.flock(fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        fh.close()
+        return False
+    _janitor_lock_file = fh
+    return True
+
+
+def _janitor() -> None:
+    while True:
+        try:
+            if _holds_janitor_lock() and _cleanup_lock.acquire(blocking=False):
+                try:
+                    # Meeting rows don't touch the folder mtimes; their
+                    # sweep is an indexed DELETE, cheap enough every tick.
+                    purge_old_meetings()
+                    resume_batch_watchers()
+                    mtimes = _folder_mtimes()
+                    if _last_sweep["remaining"] != 0 or mtimes != _last_sweep["mtimes"]:
+                        _last_sweep["remaining"] = cleanup_old_files()
+                        _last_sweep["mtimes"] = mtimes
+                    if time.time() - _last_sweep["caches_at"] >= CACHE_SWEEP_INTERVAL_SECONDS:
+                        cleanup_cache_folders()
+                        _last_sweep["caches_at"] = time.time()
+                finally:
+                    _cleanup_lock.release()
+        except Exception as e:
+            logger.warning("Janitor error: %s", e)
+        time.sleep(JANITOR_INTERVAL_SECONDS)
+
+
+def start_janitor() -> None:
+    """
+    Run cleanup_old_files periodically, off the request path. Started per
+    worker by gunicorn.conf.py once the app is loaded, so importing this
+    module (tests, tooling) doesn't spawn it.
+    """
+    threading.Thread(target=_janitor, name="janitor", daemon=True).start()
+
+
+def atomic_write_bytes(dir_: str, name: str, data: bytes) -> None:
+    """
+    Write dir_/name so readers (and the janitor) only ever see a complete
+    file. On Linux the bytes go to an unnamed O_TMPFILE inode that is linked
+    in once fully written; elsewhere (macOS) a named temp file is used. The
+    final os.replace is what makes overwriting atomic, since link() cannot
+    replace an existing name.
+    """
+    tmp_name = f".{name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    dir_fd = os.open(dir_, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        fd = -1
+        unnamed = False
+        if hasattr(os, "O_TMPFILE"):
+            try:
+                fd = os.open(".", os.O_TMPFILE | os.O_WRONLY, 0o644, dir_fd=dir_fd)
+                unnamed = True
+            except OSError:
+                pass  # filesystem without O_TMPFILE support
+        if fd < 0:
+            fd = os.open(tmp_name, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644, dir_fd=dir_fd)
+
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            if unnamed:
+                # linkat(AT_SYMLINK_FOLLOW) through /proc names the unnamed inode
+                os.link(f"/proc/self/fd/{fd}", tmp_name, src_dir_fd=dir_fd, dst_dir_fd=dir_fd, follow_symlinks=True)
+            os.replace(tmp_name, name, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+        except BaseException:
+            try:
+                os.remove(tmp_name, dir_fd=dir_fd)
+            except FileNotFoundError:
+                pass
+            raise
+        finally:
+            os.close(fd)
+    finally:
+        os.close(dir_fd)
 
 
 # ----------------------------
 # Transcription
 # ----------------------------
-def transcribe_audio_file(file_path: str) -> tuple[str, str]:
+def transcribe_audio_stream(filename: str, fileobj, mimetype: str = "") -> tuple[str, str]:
     """
-    Use OpenAI Whisper to transcribe audio to text.
+    Use OpenAI Whisper to transcribe audio to text, streaming the upload
+    straight through instead of round-tripping it via the uploads folder.
     
     Returns:
         (transcript_text, detected_language)
     """
-    logger.info("Transcribing file: %s", file_path)
-    with open(file_path, "rb") as f:
-        result = client.audio.transcriptions.create(
-            model="whisper-1",
-            file=f,
-        )
+    logger.info("Transcribing upload: %s", filename)
+    result = _client().with_options(timeout=WHISPER_TIMEOUT_SECONDS).audio.transcriptions.create(
+        model="whisper-1",
+        file=(filename, fileobj, mimetype or "application/octet-stream"),
+        # verbose_json adds the spoken language (e.g. "spanish") to the text
+        response_format="verbose_json",
+    )
     transcript = result.text or ""
-    # Whisper automatically detects language; we'll use GPT to confirm
-    detected_language = getattr(result, 'language', 'en')
+    detected_language = (getattr(result, "language", "") or "").strip().title()
     return transcript, detected_language
 
 
+def audio_digest(fileobj) -> str:
+    """BLAKE2b of the upload's bytes; rewinds the stream for the next reader."""
+    h = hashlib.blake2b()
+    for chunk in iter(lambda: fileobj.read(1024 * 1024), b""):
+        h.update(chunk)
+    fileobj.seek(0)
+    return h.hexdigest()
+
+
+def _transcript_cache_path(digest: str) -> str:
+    return os.path.join(TRANSCRIPT_CACHE_FOLDER, f"{digest}.json")
+
+
+def load_cached_transcript(digest: str) -> tuple[str, str] | None:
+    """(transcript, language reported by Whisper), or None on a miss."""
+    path = _transcript_cache_path(digest)
+    try:
+        with open(path, "rb") as f:
+            entry = orjson.loads(f.read())
+    except FileNotFoundError:
+        return None
+    # mtime doubles as "last used" for LRU eviction
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return entry.get("text") or "", entry.get("language") or ""
+
+
+def store_cached_transcript(digest: str, transcript: str, language: str = "") -> None:
+    atomic_write_bytes(
+        TRANSCRIPT_CACHE_FOLDER,
+        os.path.basename(_transcript_cache_path(digest)),
+        orjson.dumps({"text": transcript, "language": language}),
+    )
+
+    entries = [e for e in os.scandir(TRANSCRIPT_CACHE_FOLDER) if e.name.endswith(".json")]
+    if len(entries) > TRANSCRIPT_CACHE_MAX_ENTRIES:
+        entries.sort(key=lambda e: e.stat().st_mtime)
+        for e in entries[:len(entries) - TRANSCRIPT_CACHE_MAX_ENTRIES]:
+            try:
+                os.remove(e.path)
+            except FileNotFoundError:
+                pass
+
+
+def spool_and_hash(src, dst) -> str:
+    """Copy src to dst in UPLOAD_CHUNK_SIZE chunks, hashing on the way; rewinds dst."""
+    h = hashlib.blake2b()
+    for chunk in iter(lambda: src.read(UPLOAD_CHUNK_SIZE), b""):
+        h.update(chunk)
+        dst.write(chunk)
+    dst.seek(0)
+    return h.hexdigest()
+
+
+def transcribe_with_cache(filename: str, fileobj, mimetype: str = "", digest: str = "") -> tuple[str, str]:
+    """
+    Transcribe an upload, reusing the transcript of byte-identical audio
+    transcribed earlier, along with the language Whisper reported for it.
+    """
+    digest = digest or audio_digest(fileobj)
+    cached = load_cached_transcript(digest)
+    if cached is not None:
+        logger.info("Transcript cache hit for %s (%s)", filename, digest[:12])
+        return cached
+
+    transcript, detected_language = transcribe_audio_stream(filename, fileobj, mimetype)
+    try:
+        store_cached_transcript(digest, transcript, detected_language)
+    except Exception as e:
+        logger.warning("Could not cache transcript for %s: %s", filename, e)
+    return transcript, detected_language
+
+
+def save_upload_copy(file, filename: str) -> None:
+    """Debug aid (SAVE_UPLOADS=1): keep a copy of the uploaded audio on disk."""
+    save_path = os.path.join(app.config["UPLOAD_FOLDER"], filename)
+    try:
+        file.save(save_path)
+        logger.info("Saved file to: %s", os.path.abspath(save_path))
+    except Exception as e:
+        logger.warning("Could not save upload copy %s: %s", save_path, e)
+    finally:
+        file.stream.seek(0)
+
+
 # ----------------------------
 # Language Detection & Translation
 # ----------------------------
-def detect_and_translate_if_needed(text: str, source_language: str = "") -> tuple[str, str, bool]:
+def _detect_language(text: str) -> dict:
     """
-    Detect the language of the text and translate to English if needed.
-    
-    Returns:
-        (translated_text, language_name, was_translated)
+    One short JSON-mode call on the opening of the text, returning
+    detected_language, language_code and is_english.
     """
-    if not text.strip():
-        return text, "Unknown", False
-    
-    # Use GPT to detect language
+    sample = text[:1000]
+
+    # Re-uploads and re-processed transcripts skip the call entirely
+    cache_key = LLMCache.key_for(
+        {
+            "task": "detect_language",
+            "model": "gpt-4o-mini",
+            "text": hashlib.blake2b(sample.encode("utf-8"), digest_size=16).hexdigest(),
+        }
+    )
+    cached = llm_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Language detection cache hit (%s)", cache_key[:12])
+        return cached
+
     detection_prompt = f"""Analyze this text and respond with ONLY a JSON object (no other text):
 
 {{
@@ -121,69 +507,159 @@ def detect_and_translate_if_needed(text: str, source_language: str = "") -> tupl
 }}
 
 Text to analyze:
-\"\"\"{text[:1000]}\"\"\"
+\"\"\"{sample}\"\"\"
 """
-    
+
+    response = _client().chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "user", "content": detection_prompt}
+        ],
+        temperature=0.0,
+        max_tokens=200,
+        response_format={"type": "json_object"},
+    )
+    result = orjson.loads((response.choices[0].message.content or "").strip())
     try:
-        response = client.chat.completions.create(
+        llm_cache.set(cache_key, result)
+    except Exception as e:
+        logger.warning("Could not cache language detection: %s", e)
+    return result
+
+
+def _translate_to_english(text: str, language_name: str) -> tuple[str, str, bool]:
+    """Translate the whole text to English; the original text on failure."""
+    cache_key = LLMCache.key_for(
+        {
+            "task": "translate_to_english",
+            "model": "gpt-4o-mini",
+            "language": language_name,
+            "text": hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest(),
+        }
+    )
+    cached = llm_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Translation cache hit (%s)", cache_key[:12])
+        return cached, language_name, True
+
+    logger.info("Translating %s text (%d chars) to English", language_name, len(text))
+
+    try:
+        translation_prompt = f"""Translate the following {language_name} text to English.
+Provide ONLY the English translation, word-for-word and complete, with no explanations or comments.
+
+{language_name} text:
+\"\"\"{text}\"\"\"
+
+English translation:"""
+
+        translation_response = _long_output_client().chat.completions.create(
             model="gpt-4o-mini",
             messages=[
-                {"role": "user", "content": detection_prompt}
+                {"role": "user", "content": translation_prompt}
             ],
             temperature=0.0,
-            max_tokens=200,
+            max_tokens=4096,  # Increased to max allowed
         )
-        
-        response_text = (response.choices[0].message.content or "").strip()
-        result = json.loads(response_text)
-        
-        language_name = result.get("detected_language", "Unknown")
-        is_english = result.get("is_english", True)
-        
-        logger.info("Detected language: %s (is_english: %s)", language_name, is_english)
-        
-        # If already English, return as-is
-        if is_english:
-            return text, language_name, False
-        
-        # For non-English, translate to English
-        logger.info("Translating %s text (%d chars) to English", language_name, len(text))
-        
-        try:
-            translation_prompt = f"""Translate the following {language_name} text to English. 
-Provide ONLY the English translation, word-for-word and complete, with no explanations or comments.
 
-{language_name} text:
-\"\"\"{text}\"\"\"
+        translated_text = (translation_response.choices[0].message.content or "").strip()
 
-English translation:"""
-            
-            translation_response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "user", "content": translation_prompt}
-                ],
-                temperature=0.0,
-                max_tokens=4096,  # Increased to max allowed
-            )
-            
-            translated_text = (translation_response.choices[0].message.content or "").strip()
-            
-            if translated_text:
-                logger.info("Successfully translated %s text to English (%d chars -> %d chars)", language_name, len(text), len(translated_text))
-                return translated_text, language_name, True
-            else:
-                logger.warning("Translation returned empty. Returning original text.")
-                return text, language_name, False
-                
-        except Exception as e:
-            logger.exception("Translation failed: %s. Returning original text in %s.", e, language_name)
+        if translated_text:
+            logger.info("Successfully translated %s text to English (%d chars -> %d chars)", language_name, len(text), len(translated_text))
+            try:
+                llm_cache.set(cache_key, translated_text)
+            except Exception as e:
+                logger.warning("Could not cache translation: %s", e)
+            return translated_text, language_name, True
+        else:
+            logger.warning("Translation returned empty. Returning original text.")
             return text, language_name, False
-        
+
+    except Exception as e:
+        logger.exception("Translation failed: %s. Returning original text in %s.", e, language_name)
+        return text, language_name, False
+
+
+def detect_and_translate_if_needed(text: str, source_language: str = "") -> tuple[str, str, bool]:
+    """
+    Detect the language of the text and translate to English if needed.
+    With source_language (as reported by Whisper) no detection call is made;
+    otherwise the opening of the text is sent to a short detection call.
+
+    Returns:
+        (translated_text, language_name, was_translated)
+    """
+    if not text.strip():
+        return text, "Unknown", False
+
+    if source_language:
+        logger.info("Language reported by Whisper: %s", source_language)
+        if source_language.lower() == "english":
+            return text, "English", False
+        return _translate_to_english(text, source_language)
+
+    try:
+        result = _detect_language(text)
     except Exception as e:
         logger.exception("Language detection failed: %s. Assuming original text is English.", e)
         return text, "Unknown", False
 
+    language_name = result.get("detected_language", "Unknown")
+    is_english = result.get("is_english", True)
+
+    logger.info("Detected language: %s (is_english: %s)", language_name, is_english)
+
+    # If already English, return as-is
+    if is_english:
+        return text, language_name, False
+
+    return _translate_to_english(text, language_name)
+
+
+def translate_summary(summary: str, language: str) -> str:
+    """Translate the English summary back to the meeting language; English on failure."""
+    try:
+        translate_prompt = f"""Translate this meeting summary to {language}. Keep the structure and meaning intact. Only provide the translated text.
+
+Summary:
+{summary}"""
+        with openai_semaphore:
+            translate_response = _long_output_client().chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": translate_prompt}],
+                max_tokens=2048,
+            )
+        translated = translate_response.choices[0].message.content.strip()
+        logger.info("Translated summary to %s", language)
+        return translated
+    except Exception as e:
+        logger.warning("Could not translate summary to %s: %s", language, e)
+        return summary  # Fallback to English
+
+
+def translate_action_items(action_items: list[str], language: str) -> list[str]:
+    """Translate the English action items back to the meeting language; English on failure."""
+    try:
+        action_items_text = "\n".join(action_items)
+        action_items_prompt = f"""Translate these action items to {language}. Keep the structure and meaning intact. Return as a numbered list.
+
+Action Items:
+{action_items_text}"""
+        with openai_semaphore:
+            action_items_response = _long_output_client().chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": action_items_prompt}],
+                max_tokens=1024,
+            )
+        translated_items_text = action_items_response.choices[0].message.content.strip()
+        # Parse the translated items back into a list
+        translated = [item.strip() for item in translated_items_text.split('\n') if item.strip()]
+        logger.info("Translated action items to %s", language)
+        return translated
+    except Exception as e:
+        logger.warning("Could not translate action items to %s: %s", language, e)
+        return action_items  # Fallback to English
+
 
 # ----------------------------
 # Summarization (meeting-agnostic)
@@ -196,23 +672,25 @@ def _render_memo_to_text(data: dict) -> str:
     title = (data.get("title") or "Meeting Notes").strip()
     mtype = (data.get("meeting_type") or "other").strip()
 
-    lines: list[str] = []
+    # Written straight into one buffer rather than a list of lines + join
+    buf = StringIO()
+    w = buf.write
 
     # Header
-    lines.append(title)
-    lines.append(f"Type: {mtype}")
-    lines.append("")  # blank line
+    w(f"{title}\nType: {mtype}\n\n")
 
-    def add_section(header: str, items: list[str]):
-        if not items:
-            return
-        lines.append(header)
-        lines.append("")  # space after header
+    def add_bullets(items: list[str]):
         for it in items:
             s = str(it).strip()
             if s:
-                lines.append(f"- {s}")
-        lines.append("")  # space after section
+                w(f"- {s}\n")
+
+    def add_section(header: str, items: list[str]):
+        if not items:
+            return
+        w(f"{header}\n\n")  # space after header
+        add_bullets(items)
+        w("\n")  # space after section
 
     # Core sections
     add_section("Summary", data.get("summary_bullets") or [])
@@ -224,162 +702,547 @@ def _render_memo_to_text(data: dict) -> str:
     # Detailed notes
     sections = data.get("notes_by_section") or []
     if sections:
-        lines.append("Details")
-        lines.append("")
+        w("Details\n\n")
         for sec in sections:
             if not isinstance(sec, dict):
                 continue
             heading = (sec.get("heading") or "").strip()
-            bullets = sec.get("bullets") or []
 
             if heading:
-                lines.append(heading)
-                lines.append("")
+                w(f"{heading}\n\n")
 
-            for b in bullets:
-                s = str(b).strip()
-                if s:
-                    lines.append(f"- {s}")
+            add_bullets(sec.get("bullets") or [])
+            w("\n")  # space between detail subsections
 
-            lines.append("")  # space between detail subsections
+    # Trim trailing blank lines; every line above ends in one newline
+    return buf.getvalue().rstrip("\n")
 
-    # Trim trailing whitespace
-    while lines and lines[-1] == "":
-        lines.pop()
 
-    return "\n".join(lines)
+_SENTENCE_BREAK_RE = re.compile(r"(?<=[.!?])\s+")
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n{2,}")
 
 
-def summarize_and_extract_actions(transcript: str, agenda: str = "", detected_language: str = "English"):
+@lru_cache(maxsize=1)
+def _token_encoding():
+    # encoding_for_model loads (and on first use downloads) the BPE ranks
+    return tiktoken.encoding_for_model(SUMMARY_MODEL)
+
+
+def _chunk_units(text: str, max_tokens: int, enc) -> list[tuple[str, int, str]]:
     """
-    Returns:
-      summary: str
-      action_items: list[str]
-      memo_json: dict
+    Break text into (piece, n_tokens, separator) units of at most
+    max_tokens: whole paragraphs where they fit, otherwise sentences,
+    otherwise token-boundary slices. separator is what joins the piece
+    to the one before it.
+    """
+    units: list[tuple[str, int, str]] = []
+    for paragraph in _PARAGRAPH_SPLIT_RE.split(text or ""):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        n = len(enc.encode(paragraph))
+        if n <= max_tokens:
+            units.append((paragraph, n, "\n\n"))
+            continue
+        sep = "\n\n"
+        for sentence in _SENTENCE_BREAK_RE.split(paragraph):
+            if not sentence:
+                continue
+            tokens = enc.encode(sentence)
+            if len(tokens) <= max_tokens:
+                units.append((sentence, len(tokens), sep))
+                sep = " "
+                continue
+            for i in range(0, len(tokens), max_tokens):
+                piece = tokens[i:i + max_tokens]
+                units.append((enc.decode(piece), len(piece), sep))
+                sep = ""
+            sep = " "
+    return units
 
-    Strategy:
-    - Ask for JSON memo (meeting-type aware) to work for any meeting.
-    - If agenda is provided, organize summary around agenda items.
-    - Render memo into a readable summary string.
-    - Normalize action items into list[str] for your UI.
-    - Fallback to plain text if JSON mode fails.
+
+def _join_units(units: list[tuple[str, int, str]]) -> str:
+    return "".join(sep + piece for piece, _, sep in units)[len(units[0][2]):]
+
+
+def chunk_transcript(
+    text: str,
+    max_tokens: int = SUMMARY_CHUNK_TOKENS,
+    overlap_tokens: int = SUMMARY_CHUNK_OVERLAP_TOKENS,
+) -> list[str]:
     """
-    logger.info("Summarizing transcript (%d chars), agenda present: %s, detected_language: %s", len(transcript or ""), bool(agenda.strip()), detected_language)
+    Pack a transcript into chunks of at most max_tokens, breaking at
+    paragraph boundaries where possible and at sentence boundaries
+    otherwise. Each chunk repeats up to overlap_tokens of trailing text
+    from the previous one so a point made across a boundary is not lost.
+    """
+    units = _chunk_units(text, max_tokens, _token_encoding())
+
+    chunks: list[str] = []
+    current: list[tuple[str, int, str]] = []
+    current_tokens = 0
+    fresh = False  # current holds something beyond the carried-over overlap
+
+    for unit in units:
+        if fresh and current_tokens + unit[1] > max_tokens:
+            chunks.append(_join_units(current))
+            carried: list[tuple[str, int, str]] = []
+            carried_tokens = 0
+            for prev in reversed(current):
+                if carried_tokens + prev[1] > overlap_tokens:
+                    break
+                carried.insert(0, prev)
+                carried_tokens += prev[1]
+            while carried and carried_tokens + unit[1] > max_tokens:
+                carried_tokens -= carried.pop(0)[1]
+            current, current_tokens, fresh = carried, carried_tokens, False
+        current.append(unit)
+        current_tokens += unit[1]
+        fresh = True
+
+    if fresh:
+        chunks.append(_join_units(current))
+    return chunks
+
+
+def _summarize_chunk(index: int, total: int, chunk: str) -> str:
+    """Map step: condense one part of a long transcript into notes."""
+    prompt = f"""
+This is part {index} of {total} of a meeting transcript.
+Its opening lines may repeat the end of the previous part for context.
+Write concise bullet-point notes covering everything discussed in this part.
+Preserve names, exact numbers, dates, decisions, commitments and assigned next steps verbatim.
+Do NOT infer anything that is not stated.
+
+Transcript part:
+\"\"\"{chunk}\"\"\"
+""".strip()
 
-    agenda_instruction = ""
-    if agenda.strip():
-        agenda_instruction = f"""
+    with openai_semaphore:
+        resp = _client().chat.completions.create(
+            model=SUMMARY_MODEL,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.2,
+            max_tokens=900,
+        )
+    return (resp.choices[0].message.content or "").strip()
 
-IMPORTANT: The meeting had the following agenda:
-{agenda}
 
-When structuring your notes, organize them by agenda items. Any discussion that doesn't fit the agenda should be placed in sections labeled "Opening Conversation" or "Other".
-In the notes_by_section, use the agenda items as headings where applicable."""
+def condense_long_transcript(transcript: str) -> str:
+    """
+    Map step of map-reduce summarization. Transcripts that fit in a single
+    call are returned unchanged; longer ones are chunked and each chunk is
+    condensed in parallel, returning the partial notes in meeting order.
+    """
+    # Every BPE token covers at least one UTF-8 byte, so a transcript with
+    # no more bytes than the budget fits without tokenizing it at all.
+    if len((transcript or "").encode("utf-8")) <= SUMMARY_SINGLE_CALL_MAX_TOKENS:
+        return transcript
 
-    prompt_text = f"""
-You are an enterprise meeting assistant.
+    n_tokens = len(_token_encoding().encode(transcript))
+    if n_tokens <= SUMMARY_SINGLE_CALL_MAX_TOKENS:
+        return transcript
 
-Step 1: Identify meeting type.
-Choose ONE meeting_type from:
-recruiting, interview, sales, customer_discovery, planning, status_update, standup, technical_review, support, 1on1, other
+    chunks = chunk_transcript(transcript)
 
-Step 2: Produce a structured meeting memo as JSON using EXACTLY this schema:
+    logger.info("Transcript (%d tokens) split into %d chunks for map-reduce summarization", n_tokens, len(chunks))
+    futures = [
+        executor.submit(_summarize_chunk, i, len(chunks), chunk)
+        for i, chunk in enumerate(chunks, start=1)
+    ]
+    partials = [f.result() for f in futures]
+    return "\n\n".join(f"Part {i}:\n{notes}" for i, notes in enumerate(partials, start=1))
 
-{{
-  "meeting_type": "...",
-  "title": "Short descriptive title (max 10 words)",
-  "summary_bullets": ["3-8 bullets, high signal"],
-  "key_topics": ["3-10 short topic phrases"],
-  "decisions": [],
-  "action_items": [
-    {{"item":"Action", "owner":"Name/role or Unassigned", "due":"Date or Not stated"}}
-  ],
-  "risks_blockers": [],
-  "open_questions": [],
-  "notes_by_section": [
-    {{"heading":"Section heading", "bullets":["Bullets..."]}}
-  ]
-}}
+
+MEETING_TYPES = [
+    "recruiting", "interview", "sales", "customer_discovery", "planning", "status_update",
+    "standup", "technical_review", "support", "1on1", "other",
+]
+
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+
+# Strict structured-output schema for the memo. The model only emits values
+# for it, and strict mode guarantees the reply parses against it.
+_MEMO_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "meeting_type": {"type": "string", "enum": MEETING_TYPES},
+        "title": {"type": "string", "description": "Short descriptive title (max 10 words)"},
+        "summary_bullets": {**_STRING_LIST, "description": "3-8 bullets, high signal"},
+        "key_topics": {**_STRING_LIST, "description": "3-10 short topic phrases"},
+        "decisions": _STRING_LIST,
+        "action_items": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "item": {"type": "string", "description": "Action"},
+                    "owner": {"type": "string", "description": "Name/role or Unassigned"},
+                    "due": {"type": "string", "description": "Date or Not stated"},
+                },
+                "required": ["item", "owner", "due"],
+                "additionalProperties": False,
+            },
+        },
+        "risks_blockers": _STRING_LIST,
+        "open_questions": _STRING_LIST,
+        "notes_by_section": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "heading": {"type": "string"},
+                    "bullets": _STRING_LIST,
+                },
+                "required": ["heading", "bullets"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": [
+        "meeting_type", "title", "summary_bullets", "key_topics", "decisions",
+        "action_items", "risks_blockers", "open_questions", "notes_by_section",
+    ],
+    "additionalProperties": False,
+}
+
+
+# Fixed instructions, identical for every meeting; everything that varies
+# goes in the user message after it. Together with the schema this is only
+# ~550 tokens, below the 1024-token prefix OpenAI's prompt caching requires,
+# so it is not expected to be cached across meetings.
+MEMO_SYSTEM_PROMPT = """
+You are an enterprise meeting assistant. You are precise and structured.
+
+Step 1: Identify the meeting type.
+Step 2: Produce a structured meeting memo of the transcript.
 
 Rules:
 - Use ONLY what is explicitly stated in the transcript. Do NOT infer.
 - Preserve exact numbers and commitments verbatim (prices, dates, headcount, utilization, SLA, etc.).
 - If something is not discussed, leave arrays empty ([]) rather than adding filler.
 - Keep it concise and actionable.
-- Action items should only include explicit commitments or clearly assigned next steps.{agenda_instruction}
+- Action items should only include explicit commitments or clearly assigned next steps.
+- If the user message gives the meeting agenda, organize notes_by_section by agenda items, using them as headings where applicable. Any discussion that doesn't fit the agenda should be placed in sections labeled "Opening Conversation" or "Other".
+
+The user message contains the transcript, optionally preceded by the agenda.
+""".strip()
+
+
+def build_memo_prompt(transcript: str, agenda: str = "") -> str:
+    """Build the variable user message (agenda + transcript) for the memo call."""
+    if not agenda.strip():
+        return transcript
+    return f"""
+Agenda:
+{agenda}
 
 Transcript:
-\"\"\"{transcript}\"\"\"
+{transcript}
 """.strip()
 
-    # --- Attempt structured JSON output (newer SDKs) ---
+
+MEMO_SCHEMA_VERSION = 3  # bump when the memo prompt/schema changes to invalidate cached summaries
+# Output budget for the memo. Strict JSON mode doesn't stop the reply being
+# cut off at max_tokens, so a memo that hits the first budget is retried once
+# with the second rather than left as unparseable JSON.
+MEMO_MAX_TOKENS = 2000
+MEMO_RETRY_MAX_TOKENS = 4096
+
+
+def build_memo_request(transcript: str, agenda: str = "", max_tokens: int = MEMO_MAX_TOKENS) -> dict:
+    """
+    Chat Completions parameters for the JSON memo call. Shared by the
+    interactive path and the Batch API path so both send the same request.
+    """
+    return {
+        "model": SUMMARY_MODEL,
+        "messages": [
+            {"role": "system", "content": MEMO_SYSTEM_PROMPT},
+            {"role": "user", "content": build_memo_prompt(transcript, agenda)},
+        ],
+        "temperature": 0,
+        "max_tokens": max_tokens,
+        "response_format": {
+            "type": "json_schema",
+            "json_schema": {"name": "meeting_memo", "schema": _MEMO_SCHEMA, "strict": True},
+        },
+    }
+
+
+def memo_to_summary_and_actions(data: dict) -> tuple[str, list[str]]:
+    """Render memo JSON to summary text and normalize action items to list[str]."""
+    summary_text = _render_memo_to_text(data)
+
+    # Normalize action items to list[str] for existing UI
+    action_items_raw = data.get("action_items") or []
+    action_items: list[str] = []
+    for ai in action_items_raw:
+        if isinstance(ai, str):
+            s = ai.strip()
+            if s:
+                action_items.append(s)
+        elif isinstance(ai, dict):
+            item = (ai.get("item") or "").strip()
+            owner = (ai.get("owner") or "Unassigned").strip()
+            due = (ai.get("due") or "Not stated").strip()
+            if item:
+                action_items.append(f"{item} — {owner} (Due: {due})")
+
+    return summary_text, action_items
+
+
+class LLMCache:
+    """
+    Exact-match cache of LLM results keyed by a hash of the full request.
+    Entries live in memory (bounded, oldest evicted first) and as
+    zstd-compressed JSON under LLM_CACHE_FOLDER so restarts keep them.
+    """
+
+    def __init__(self, folder: str, ttl_seconds: float, max_memory_entries: int = 512):
+        self.folder = folder
+        self.ttl_seconds = ttl_seconds
+        self.max_memory_entries = max_memory_entries
+        self._entries: OrderedDict[str, tuple[object, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(request: dict) -> str:
+        return hashlib.sha256(orjson.dumps(request, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.folder, f"{key}.json.zst")
+
+    def get(self, key: str):
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, ts = entry
+                if now - ts <= self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    return value
+                del self._entries[key]
+
+        path = self._path(key)
+        try:
+            ts = os.path.getmtime(path)
+            if now - ts > self.ttl_seconds:
+                os.remove(path)
+                return None
+            with open(path, "rb") as f:
+                value = orjson.loads(zstandard.ZstdDecompressor().decompress(f.read()))
+        except FileNotFoundError:
+            return None
+        self._remember(key, value, ts)
+        return value
+
+    def set(self, key: str, value) -> None:
+        self._remember(key, value, time.time())
+        data = zstandard.ZstdCompressor(level=3).compress(orjson.dumps(value))
+        atomic_write_bytes(self.folder, os.path.basename(self._path(key)), data)
+
+    def _remember(self, key: str, value, ts: float) -> None:
+        with self._lock:
+            self._entries[key] = (value, ts)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_memory_entries:
+                self._entries.popitem(last=False)
+
+
+llm_cache = LLMCache(LLM_CACHE_FOLDER, LLM_CACHE_TTL_SECONDS)
+
+
+@lru_cache(maxsize=1)
+def _semantic_cache():
+    """RedisVL SemanticCache, or None when REDIS_URL is unset or redisvl is not installed."""
+    if not REDIS_URL:
+        return None
     try:
-        resp = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "You are precise and structured."},
-                {"role": "user", "content": prompt_text},
-            ],
-            temperature=0.2,
-            max_tokens=900,
-            # Some SDK versions don't support this; we catch and fallback below.
-            response_format={"type": "json_object"},
+        from redisvl.extensions.cache.llm import SemanticCache
+        from redisvl.utils.vectorize import HFTextVectorizer
+    except ImportError:
+        logger.warning("REDIS_URL is set but redisvl is not installed; semantic cache disabled.")
+        return None
+    return SemanticCache(
+        name="meeting_memo_by_day",
+        redis_url=REDIS_URL,
+        distance_threshold=SEMANTIC_CACHE_DISTANCE_THRESHOLD,
+        ttl=24 * 60 * 60,  # entries only match on the day they were stored
+        vectorizer=HFTextVectorizer("redis/langcache-embed-v1"),
+        filterable_fields=[{"name": "day", "type": "tag"}],
+    )
+
+
+def _semantic_cache_day() -> str:
+    return datetime.now().strftime("%Y-%m-%d")
+
+
+def _semantic_cache_prompt(transcript: str, agenda: str) -> str:
+    # The opening of the meeting is enough to recognise a re-upload
+    return f"Agenda: {agenda}\n\nTranscript: {transcript}"[:SEMANTIC_CACHE_PROMPT_CHARS]
+
+
+def semantic_cache_lookup(transcript: str, agenda: str) -> dict | None:
+    """Memo JSON of a near-duplicate meeting summarized earlier today, if any."""
+    cache = _semantic_cache()
+    if cache is None:
+        return None
+    from redisvl.query.filter import Tag
+
+    try:
+        hits = cache.check(
+            prompt=_semantic_cache_prompt(transcript, agenda),
+            num_results=1,
+            filter_expression=Tag("day") == _semantic_cache_day(),
+        )
+    except Exception as e:
+        logger.warning("Semantic cache lookup failed: %s", e)
+        return None
+    if not hits:
+        return None
+    return orjson.loads(hits[0]["response"])
+
+
+def semantic_cache_store(transcript: str, agenda: str, memo_json: dict) -> None:
+    cache = _semantic_cache()
+    if cache is None:
+        return
+    try:
+        cache.store(
+            prompt=_semantic_cache_prompt(transcript, agenda),
+            response=orjson.dumps(memo_json).decode(),
+            filters={"day": _semantic_cache_day()},
         )
+    except Exception as e:
+        logger.warning("Semantic cache store failed: %s", e)
+
+
+def summarize_and_extract_actions(transcript: str, agenda: str = "", detected_language: str = "English"):
+    """
+    Returns:
+      summary: str
+      action_items: list[str]
+      memo_json: dict
 
-        content = (resp.choices[0].message.content or "").strip()
-        data = json.loads(content) if content else {}
-
-        summary_text = _render_memo_to_text(data)
-
-        # Normalize action items to list[str] for existing UI
-        action_items_raw = data.get("action_items") or []
-        action_items: list[str] = []
-        for ai in action_items_raw:
-            if isinstance(ai, str):
-                s = ai.strip()
-                if s:
-                    action_items.append(s)
-            elif isinstance(ai, dict):
-                item = (ai.get("item") or "").strip()
-                owner = (ai.get("owner") or "Unassigned").strip()
-                due = (ai.get("due") or "Not stated").strip()
-                if item:
-                    action_items.append(f"{item} — {owner} (Due: {due})")
+    Strategy:
+    - Ask for JSON memo (meeting-type aware) to work for any meeting.
+    - If agenda is provided, organize summary around agenda items.
+    - Render memo into a readable summary string.
+    - Normalize action items into list[str] for your UI.
+    - The memo is requested with a strict JSON schema, so there is no
+      plain-text fallback.
+    - Transcripts too long for one call are map-reduced: chunks are
+      condensed in parallel and the combined notes are summarized.
+    - Results are cached by a hash of the exact request (llm_cache) and,
+      when REDIS_URL is set, by similarity to earlier transcripts.
+    """
+    logger.info("Summarizing transcript (%d chars), agenda present: %s, detected_language: %s", len(transcript or ""), bool(agenda.strip()), detected_language)
 
+    # Identical transcript + agenda + model settings -> reuse the earlier result
+    cache_key = LLMCache.key_for({**build_memo_request(transcript, agenda), "schema_ver": MEMO_SCHEMA_VERSION})
+    cached = llm_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Summary cache hit (%s)", cache_key[:12])
+        summary_text, action_items, data = cached
         return summary_text, action_items, data
 
-    except Exception as e:
-        logger.exception("Structured summarization failed; using fallback. Error: %s", e)
+    # Near-duplicate meeting (e.g. a re-recording or slightly edited upload)
+    data = semantic_cache_lookup(transcript, agenda)
+    if data:
+        logger.info("Semantic summary cache hit")
+        summary_text, action_items = memo_to_summary_and_actions(data)
+    else:
+        summary_text, action_items, data = _summarize_uncached(transcript, agenda)
+        if data:
+            semantic_cache_store(transcript, agenda, data)
 
-    # --- Fallback: plain text (always works) ---
-    fallback_prompt = f"""
-Summarize the transcript in 5-10 bullet points (high signal, no fluff).
-Then list action items as '-' bullets in the format: "Action — Owner (Due: ...)".
-If none, write: None.
+    if summary_text:
+        try:
+            llm_cache.set(cache_key, [summary_text, action_items, data])
+        except Exception as e:
+            logger.warning("Could not cache summary: %s", e)
+    return summary_text, action_items, data
 
-Transcript:
-\"\"\"{transcript}\"\"\"
-""".strip()
 
+def _summarize_uncached(transcript: str, agenda: str):
+    """summarize_and_extract_actions without the cache lookup."""
     try:
-        resp = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": fallback_prompt}],
-            temperature=0.2,
-            max_tokens=900,
-        )
-        text = (resp.choices[0].message.content or "").strip()
-        action_items = [ln[2:].strip() for ln in text.splitlines() if ln.strip().startswith("- ")]
-        return text, action_items, {}
-    except Exception as e2:
-        logger.exception("Fallback summarization failed: %s", e2)
+        transcript = condense_long_transcript(transcript)
+    except Exception as e:
+        logger.exception("Chunked summarization failed: %s", e)
+        return "", [], {}
+
+    # Strict structured output: the reply always parses against _MEMO_SCHEMA
+    # unless the model refuses or runs out of tokens.
+    try:
+        for max_tokens in (MEMO_MAX_TOKENS, MEMO_RETRY_MAX_TOKENS):
+            resp = _long_output_client().chat.completions.create(**build_memo_request(transcript, agenda, max_tokens))
+            choice = resp.choices[0]
+            if choice.finish_reason != "length":
+                break
+            logger.warning("Memo cut off at %d tokens", max_tokens)
+        else:
+            return "", [], {}
+
+        message = choice.message
+        if getattr(message, "refusal", None):
+            logger.warning("Summarization refused: %s", message.refusal)
+            return "", [], {}
+
+        content = (message.content or "").strip()
+        data = orjson.loads(content) if content else {}
+    except Exception as e:
+        logger.exception("Structured summarization failed: %s", e)
         return "", [], {}
 
+    summary_text, action_items = memo_to_summary_and_actions(data)
+    return summary_text, action_items, data
+
 
 # ----------------------------
-# Meeting artifact storage (JSON)
+# Meeting artifact storage (SQLite)
 # ----------------------------
-_MEETING_ID_RE = re.compile(r"^[A-Za-z0-9_-]{6,80}$")
+_MEETING_ID_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+
+# One row per meeting instead of a file each, so a download is an indexed
+# lookup and the janitor never lists thousands of artifacts. WAL lets every
+# worker process read while another one writes.
+MEETINGS_DB_PATH = os.path.join(LOG_FOLDER, "meetings.db")
+
+_meetings_db: sqlite3.Connection | None = None
+# The connection is shared by all threads (and greenlets under gevent);
+# statements are sub-millisecond, so serializing them is cheap.
+_meetings_db_lock = threading.Lock()
+
+
+def _meetings_conn() -> sqlite3.Connection:
+    # Call with _meetings_db_lock held
+    global _meetings_db
+    if _meetings_db is None:
+        conn = sqlite3.connect(MEETINGS_DB_PATH, timeout=10, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS meetings ("
+            " id TEXT PRIMARY KEY,"
+            " created_at INTEGER NOT NULL,"
+            " expires_at INTEGER NOT NULL,"
+            " version INTEGER NOT NULL,"
+            " payload BLOB NOT NULL)"
+        )
+        if "expires_at" not in {row[1] for row in conn.execute("PRAGMA table_info(meetings)")}:
+            # Databases from before per-meeting retention
+            conn.execute("ALTER TABLE meetings ADD COLUMN expires_at INTEGER NOT NULL DEFAULT 0")
+            conn.execute("UPDATE meetings SET expires_at = created_at + ?", (MAX_FILE_AGE_SECONDS,))
+        conn.execute("DROP INDEX IF EXISTS meetings_created_at")
+        conn.execute("CREATE INDEX IF NOT EXISTS meetings_expires_at ON meetings(expires_at)")
+        # Batch API jobs still being waited on, so a restarted worker can
+        # pick them up again (see resume_batch_watchers)
+        conn.execute("CREATE TABLE IF NOT EXISTS batches (id TEXT PRIMARY KEY, expires_at INTEGER NOT NULL)")
+        atexit.register(conn.close)
+        _meetings_db = conn
+    return _meetings_db
 
 
 def new_meeting_id() -> str:
@@ -388,17 +1251,26 @@ def new_meeting_id() -> str:
 
 
 def safe_meeting_id(meeting_id: str) -> str:
-    if not meeting_id or not _MEETING_ID_RE.match(meeting_id):
+    # 6-80 chars of [A-Za-z0-9_-]; a set check is cheaper than a regex match
+    if not (meeting_id and 6 <= len(meeting_id) <= 80 and _MEETING_ID_CHARS.issuperset(meeting_id)):
         raise ValueError("Invalid meeting_id")
     return meeting_id
 
 
-def meeting_json_path(meeting_id: str) -> str:
+def _meeting_version(meeting_id: str) -> int:
+    """
+    Version of a meeting's stored artifacts; every save bumps it, so caches
+    keyed on it never serve a stale copy. FileNotFoundError if not stored.
+    """
     meeting_id = safe_meeting_id(meeting_id)
-    return os.path.join(TRANSCRIPT_FOLDER, f"{meeting_id}.json")
+    with _meetings_db_lock:
+        row = _meetings_conn().execute("SELECT version FROM meetings WHERE id = ?", (meeting_id,)).fetchone()
+    if row is None:
+        raise FileNotFoundError(meeting_id)
+    return row[0]
 
 
-def save_meeting_artifacts(meeting_id: str, filename: str, transcript: str, summary: str, action_items: list, original_language: str = "English", was_translated: bool = False) -> None:
+def save_meeting_artifacts(meeting_id: str, filename: str, transcript: str, summary: str, action_items: list, original_language: str = "English", was_translated: bool = False, localization_pending: bool = False, memo_json: dict | None = None, retention_seconds: int = MAX_FILE_AGE_SECONDS, original_transcript: str = "") -> None:
     payload = {
         "meeting_id": meeting_id,
         "created_at": datetime.now().isoformat(timespec="seconds"),
@@ -406,25 +1278,163 @@ def save_meeting_artifacts(meeting_id: str, filename: str, transcript: str, summ
         "original_language": original_language,
         "was_translated": was_translated,
         "transcript": transcript or "",
+        # Untranslated transcript, when "transcript" is a translation
+        "original_transcript": original_transcript if was_translated else "",
         "summary": summary or "",
         "action_items": action_items or [],
+        "localization_pending": localization_pending,
+        # Raw structured memo from the model, kept for debugging / inspection
+        "memo": memo_json or {},
+    }
+    _write_meeting_payload(meeting_id, payload, retention_seconds)
+
+
+def _compress_payload(payload: dict) -> bytes:
+    # Transcripts shrink 4-6x under zstd; compress before taking the lock
+    return zstandard.ZstdCompressor(level=3).compress(orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS))
+
+
+def _write_meeting_payload(meeting_id: str, payload: dict, retention_seconds: int = MAX_FILE_AGE_SECONDS) -> None:
+    blob = _compress_payload(payload)
+    meeting_id = safe_meeting_id(meeting_id)
+    now = int(time.time())
+    with _meetings_db_lock:
+        # An upsert rather than INSERT OR REPLACE keeps the original
+        # created_at/expires_at, so re-saving a meeting doesn't extend its lifetime.
+        ((version,),) = _meetings_conn().execute(
+            "INSERT INTO meetings (id, created_at, expires_at, version, payload) VALUES (?, ?, ?, 1, ?)"
+            " ON CONFLICT(id) DO UPDATE SET version = version + 1, payload = excluded.payload"
+            " RETURNING version",
+            (meeting_id, now, now + retention_seconds, blob),
+        ).fetchall()
+    # The PDF download usually follows right away; serve it from memory
+    _remember_meeting(meeting_id, version, payload)
+
+
+def update_meeting_payload(meeting_id: str, payload: dict) -> bool:
+    """
+    Replace a stored meeting's artifacts, but never recreate one that was
+    discarded or has expired in the meantime.
+
+    Returns:
+        whether the meeting still existed and was updated
+    """
+    blob = _compress_payload(payload)
+    meeting_id = safe_meeting_id(meeting_id)
+    with _meetings_db_lock:
+        rows = _meetings_conn().execute(
+            "UPDATE meetings SET version = version + 1, payload = ? WHERE id = ? RETURNING version",
+            (blob, meeting_id),
+        ).fetchall()
+    if not rows:
+        return False
+    _remember_meeting(meeting_id, rows[0][0], payload)
+    return True
+
+
+def save_localized_artifacts(meeting_id: str, language: str, summary: str, action_items: list) -> None:
+    """Add the summary + action items translated back to the meeting language."""
+    payload = {
+        **load_meeting_artifacts(meeting_id),
+        "localization_pending": False,
+        "localized": {"language": language, "summary": summary or "", "action_items": action_items or []},
     }
-    with open(meeting_json_path(meeting_id), "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+    if not update_meeting_payload(meeting_id, payload):
+        logger.info("Meeting %s was removed before its translation was saved", meeting_id)
+
+
+def purge_old_meetings() -> int:
+    """
+    Delete meetings (and batch jobs) past their expires_at: an index range
+    scan, however many meetings are stored.
+
+    Returns:
+        number of meetings deleted
+    """
+    now = int(time.time())
+    with _meetings_db_lock:
+        conn = _meetings_conn()
+        cur = conn.execute("DELETE FROM meetings WHERE expires_at < ?", (now,))
+        conn.execute("DELETE FROM batches WHERE expires_at < ?", (now,))
+    if cur.rowcount:
+        logger.info("Deleted %d old meetings", cur.rowcount)
+    return cur.rowcount
+
+
+def meeting_status_path(meeting_id: str) -> str:
+    meeting_id = safe_meeting_id(meeting_id)
+    return os.path.join(TRANSCRIPT_FOLDER, f"{meeting_id}.status.json")
+
+
+def write_meeting_status(meeting_id: str, status: str, **fields) -> None:
+    """
+    Record a background job's state ("queued", "processing", "done",
+    "submitted" for a batch, or "error") and when it was entered. Kept on disk so any worker process
+    can answer /status; the results themselves are only in the meetings
+    database.
+    """
+    payload = {"meeting_id": meeting_id, "status": status, "updated_at": int(time.time()), **fields}
+    atomic_write_bytes(
+        TRANSCRIPT_FOLDER,
+        os.path.basename(meeting_status_path(meeting_id)),
+        orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS),
+    )
+
+
+def read_meeting_status(meeting_id: str) -> dict | None:
+    try:
+        with open(meeting_status_path(meeting_id), "rb") as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
+        return None
+
+
+# Recently saved or loaded meetings: meeting_id -> (version, artifacts)
+_ARTIFACT_CACHE: OrderedDict[str, tuple[int, dict]] = OrderedDict()
+_ARTIFACT_CACHE_MAX_ENTRIES = 256
+_artifact_cache_lock = threading.Lock()
+
+
+def _remember_meeting(meeting_id: str, version: int, data: dict) -> None:
+    with _artifact_cache_lock:
+        _ARTIFACT_CACHE[meeting_id] = (version, data)
+        _ARTIFACT_CACHE.move_to_end(meeting_id)
+        while len(_ARTIFACT_CACHE) > _ARTIFACT_CACHE_MAX_ENTRIES:
+            _ARTIFACT_CACHE.popitem(last=False)
+
+
+def _load_meeting_cached(meeting_id: str, version: int) -> dict:
+    # A cached copy is only used while its version is current, so a save
+    # from another worker process is picked up.
+    with _artifact_cache_lock:
+        entry = _ARTIFACT_CACHE.get(meeting_id)
+        if entry is not None and entry[0] == version:
+            _ARTIFACT_CACHE.move_to_end(meeting_id)
+            return entry[1]
+
+    with _meetings_db_lock:
+        row = _meetings_conn().execute("SELECT version, payload FROM meetings WHERE id = ?", (meeting_id,)).fetchone()
+    if row is None:
+        raise FileNotFoundError(meeting_id)
+    data = orjson.loads(zstandard.ZstdDecompressor().decompress(row[1]))
+    _remember_meeting(meeting_id, row[0], data)
+    return data
 
 
 def load_meeting_artifacts(meeting_id: str) -> dict:
-    path = meeting_json_path(meeting_id)
-    if not os.path.exists(path):
-        raise FileNotFoundError(path)
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    """Load a meeting's artifacts. The returned dict is shared; do not mutate it."""
+    return _load_meeting_cached(meeting_id, _meeting_version(meeting_id))
 
 
 def delete_meeting_artifacts(meeting_id: str) -> None:
-    path = meeting_json_path(meeting_id)
+    meeting_id = safe_meeting_id(meeting_id)
+    evict_cached_pdf(meeting_id)
+    with _artifact_cache_lock:
+        _ARTIFACT_CACHE.pop(meeting_id, None)
+    with _meetings_db_lock:
+        _meetings_conn().execute("DELETE FROM meetings WHERE id = ?", (meeting_id,))
     try:
-        os.remove(path)
+        os.remove(meeting_status_path(meeting_id))
     except FileNotFoundError:
         pass
 
@@ -432,51 +1442,198 @@ def delete_meeting_artifacts(meeting_id: str) -> None:
 # ----------------------------
 # PDF generation
 # ----------------------------
-def build_pdf_bytes(data: dict) -> bytes:
-    buf = BytesIO()
-    doc = SimpleDocTemplate(
-        buf,
-        pagesize=letter,
+_PDF_KIT: SimpleNamespace | None = None
+_pdf_kit_lock = threading.Lock()
+
+
+def _pdf_kit() -> SimpleNamespace:
+    """
+    ReportLab plus the report's styles and fixed paragraphs, imported and
+    built on the first PDF render instead of at app import; workers that
+    never serve /download never load it. The lock makes concurrent first
+    downloads build it once (lru_cache would let each of them build one).
+    """
+    global _PDF_KIT
+    if _PDF_KIT is None:
+        with _pdf_kit_lock:
+            if _PDF_KIT is None:
+                _PDF_KIT = _build_pdf_kit()
+    return _PDF_KIT
+
+
+def _build_pdf_kit() -> SimpleNamespace:
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.lib.units import inch
+    from reportlab.pdfgen import canvas
+    from reportlab.platypus import BaseDocTemplate, Frame, PageTemplate, Paragraph, Spacer, ListFlowable, ListItem
+
+    styles = getSampleStyleSheet()  # built once; styles are read-only during builds
+    title_style, heading_style = styles["Title"], styles["Heading2"]
+    body_style, normal_style = styles["BodyText"], styles["Normal"]
+    body_continued_style = ParagraphStyle("BodyTextContinued", parent=body_style, spaceBefore=0)
+
+    # The fixed report text is parsed once. Each build gets shallow copies:
+    # they share the parsed markup, but ReportLab stores layout/canvas state
+    # on the flowable while drawing, so concurrent builds must not share one
+    # instance.
+    return SimpleNamespace(
+        letter=letter, inch=inch, canvas=canvas,
+        BaseDocTemplate=BaseDocTemplate, Frame=Frame, PageTemplate=PageTemplate,
+        Paragraph=Paragraph, Spacer=Spacer, ListFlowable=ListFlowable, ListItem=ListItem,
+        body_style=body_style,
+        body_continued_style=body_continued_style,
+        normal_style=normal_style,
+        report_title=Paragraph("Meeting Assistant Report", title_style),
+        summary_heading=Paragraph("Summary", heading_style),
+        action_items_heading=Paragraph("Action Items", heading_style),
+        no_action_items=Paragraph("No action items found.", body_style),
+        transcript_heading=Paragraph("Transcript", heading_style),
+    )
+
+
+_PARAGRAPH_BREAK_RE = re.compile(r"\n\s*\n")
+
+
+def _to_para(s) -> str:
+    """Escape text for ReportLab's Paragraph markup and keep line breaks."""
+    return html.escape(str(s or ""), quote=False).replace("\n", "<br/>\n")
+
+
+# Whisper often returns a whole meeting as one unbroken block; past this
+# size a block is cut at sentence ends into several flowables.
+PDF_PARAGRAPH_MAX_CHARS = 2000
+_SENTENCE_BREAK_KEEP_RE = re.compile(r"((?<=[.!?])\s+)")
+
+
+def _split_long_block(block: str, max_chars: int) -> list[str]:
+    """Pack whole sentences into pieces of up to max_chars (longer sentences stay whole)."""
+    if len(block) <= max_chars:
+        return [block]
+    parts = _SENTENCE_BREAK_KEEP_RE.split(block)  # sentence, break, sentence, ...
+    pieces: list[str] = []
+    current = parts[0]
+    for i in range(1, len(parts), 2):
+        sep, sentence = parts[i], parts[i + 1]
+        if len(current) + len(sep) + len(sentence) > max_chars:
+            pieces.append(current)
+            current = sentence
+        else:
+            current += sep + sentence
+    pieces.append(current)
+    return pieces
+
+
+def _text_paragraphs(text, Paragraph, style, continued_style=None) -> list:
+    """
+    One flowable per blank-line-separated block, and per ~PDF_PARAGRAPH_MAX_CHARS
+    of a longer block: Paragraph parsing cost grows faster than linearly with
+    size (one 200 KB block takes over 20x longer than the same text in
+    pieces), and small flowables split across pages cheaply. Pieces after
+    the first in a block use continued_style, so no paragraph gap is added.
+    """
+    flowables = []
+    for para in _PARAGRAPH_BREAK_RE.split(text or ""):
+        if not para.strip():
+            continue
+        for i, piece in enumerate(_split_long_block(para, PDF_PARAGRAPH_MAX_CHARS)):
+            flowables.append(Paragraph(_to_para(piece), continued_style if i and continued_style else style))
+    return flowables
+
+
+PDF_SPOOL_MAX_BYTES = 512 * 1024  # larger reports spill from RAM to a temp file
+
+
+def build_pdf_to(data: dict, fileobj) -> None:
+    """Render the meeting report into a writable binary file object."""
+    rl = _pdf_kit()
+    inch = rl.inch
+    doc = rl.BaseDocTemplate(
+        fileobj,
+        pagesize=rl.letter,
         leftMargin=0.8 * inch,
         rightMargin=0.8 * inch,
         topMargin=0.8 * inch,
         bottomMargin=0.8 * inch,
     )
-    styles = getSampleStyleSheet()
+    # One page template with one frame (same geometry SimpleDocTemplate
+    # uses): no First/Later template switching, so flowables flow linearly.
+    frame = rl.Frame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height, id="body")
+    doc.addPageTemplates([rl.PageTemplate(id="page", frames=[frame])])
 
+    Paragraph = rl.Paragraph
     story = []
-    story.append(Paragraph("Meeting Assistant Report", styles["Title"]))
-    story.append(Spacer(1, 12))
+    story.append(copy.copy(rl.report_title))
+    story.append(rl.Spacer(1, 12))
 
-    story.append(Paragraph(f"Meeting ID: {data.get('meeting_id','')}", styles["Normal"]))
-    story.append(Paragraph(f"Created: {data.get('created_at','')}", styles["Normal"]))
+    story.append(Paragraph(f"Meeting ID: {_to_para(data.get('meeting_id'))}", rl.normal_style))
+    story.append(Paragraph(f"Created: {_to_para(data.get('created_at'))}", rl.normal_style))
     src = data.get("source_filename") or ""
     if src:
-        story.append(Paragraph(f"Source file: {src}", styles["Normal"]))
-    story.append(Spacer(1, 12))
+        story.append(Paragraph(f"Source file: {_to_para(src)}", rl.normal_style))
+    story.append(rl.Spacer(1, 12))
 
-    story.append(Paragraph("Summary", styles["Heading2"]))
-    story.append(Paragraph((data.get("summary") or "").replace("\n", "<br/>"), styles["BodyText"]))
-    story.append(Spacer(1, 12))
+    story.append(copy.copy(rl.summary_heading))
+    story.extend(_text_paragraphs(data.get("summary"), Paragraph, rl.body_style))
+    story.append(rl.Spacer(1, 12))
 
-    story.append(Paragraph("Action Items", styles["Heading2"]))
+    story.append(copy.copy(rl.action_items_heading))
     items = data.get("action_items") or []
     if items:
         story.append(
-            ListFlowable(
-                [ListItem(Paragraph(str(x), styles["BodyText"])) for x in items],
+            rl.ListFlowable(
+                [rl.ListItem(Paragraph(_to_para(x), rl.body_style)) for x in items],
                 bulletType="1",
             )
         )
     else:
-        story.append(Paragraph("No action items found.", styles["BodyText"]))
-    story.append(Spacer(1, 12))
+        story.append(copy.copy(rl.no_action_items))
+    story.append(rl.Spacer(1, 12))
+
+    story.append(copy.copy(rl.transcript_heading))
+    story.extend(_text_paragraphs(data.get("transcript"), Paragraph, rl.body_style, rl.body_continued_style))
+
+    doc.build(story, canvasmaker=rl.canvas.Canvas)
+
 
-    story.append(Paragraph("Transcript", styles["Heading2"]))
-    story.append(Paragraph((data.get("transcript") or "").replace("\n", "<br/>"), styles["BodyText"]))
+_PDF_CACHE: OrderedDict[tuple[str, int], bytes] = OrderedDict()
+_PDF_CACHE_MAX_ENTRIES = 64
+_pdf_cache_lock = threading.Lock()
 
-    doc.build(story)
-    return buf.getvalue()
+
+def meeting_pdf_stream(meeting_id: str):
+    """
+    Render a meeting's PDF report, reusing the last rendering while the
+    stored meeting is unchanged (keyed by meeting_id + version). Only reports
+    that fit in PDF_SPOOL_MAX_BYTES are kept in the cache.
+    """
+    version = _meeting_version(meeting_id)
+    key = (meeting_id, version)
+    with _pdf_cache_lock:
+        pdf_bytes = _PDF_CACHE.get(key)
+        if pdf_bytes is not None:
+            _PDF_CACHE.move_to_end(key)
+            return BytesIO(pdf_bytes)  # shares the bytes until written to
+
+    # Small reports stay in memory; huge transcripts spill to disk
+    buf = tempfile.SpooledTemporaryFile(max_size=PDF_SPOOL_MAX_BYTES)
+    build_pdf_to(_load_meeting_cached(meeting_id, version), buf)
+    size = buf.tell()
+    buf.seek(0)
+    if size <= PDF_SPOOL_MAX_BYTES:
+        pdf_bytes = buf.read()
+        buf.seek(0)
+        with _pdf_cache_lock:
+            _PDF_CACHE[key] = pdf_bytes
+            while len(_PDF_CACHE) > _PDF_CACHE_MAX_ENTRIES:
+                _PDF_CACHE.popitem(last=False)
+    return buf
+
+
+def evict_cached_pdf(meeting_id: str) -> None:
+    with _pdf_cache_lock:
+        for key in [k for k in _PDF_CACHE if k[0] == meeting_id]:
+            del _PDF_CACHE[key]
 
 
 # ----------------------------
@@ -484,6 +1641,12 @@ def build_pdf_bytes(data: dict) -> bytes:
 # ----------------------------
 @app.errorhandler(413)
 def file_too_large(e):
+    # A body within MAX_CONTENT_LENGTH can only have tripped the limit on
+    # text fields (MAX_FORM_MEMORY_SIZE), i.e. the agenda
+    length = request.content_length
+    if length is not None and length <= app.config["MAX_CONTENT_LENGTH"]:
+        limit_kb = app.config["MAX_FORM_MEMORY_SIZE"] // 1024
+        return jsonify({"error": f"Agenda is too long. Limit is {limit_kb} KB."}), 413
     return jsonify({"error": "File is too large. Limit is 25 MB."}), 413
 
 
@@ -494,8 +1657,10 @@ def index():
 
 @app.route("/process", methods=["POST"])
 def process():
-    cleanup_old_files()
-
+    """
+    Queue an upload for transcription + summarization and return at once
+    with its meeting_id; poll /status/<meeting_id> for the result.
+    """
     if "audio_file" not in request.files:
         return jsonify({"error": "No file part in request."}), 400
 
@@ -504,19 +1669,177 @@ def process():
         return jsonify({"error": "No file selected."}), 400
 
     filename = secure_filename(file.filename)
-    save_path = os.path.join(app.config["UPLOAD_FOLDER"], filename)
-    file.save(save_path)
-    logger.info("Saved file to: %s", os.path.abspath(save_path))
+    if app.config["SAVE_UPLOADS"]:
+        save_upload_copy(file, filename)
 
     # Get agenda from request if present
     agenda = request.form.get("agenda", "").strip()
 
-    # Transcribe
+    # The request's own upload file is closed when the request ends, so the
+    # job gets its own copy.
+    tmp = tempfile.TemporaryFile()
+    try:
+        digest = spool_and_hash(file.stream, tmp)
+        meeting_id = new_meeting_id()
+        write_meeting_status(meeting_id, "queued")
+        job_executor.submit(_run_process_job, meeting_id, filename, tmp, file.mimetype, agenda, digest)
+    except Exception:
+        tmp.close()
+        raise
+
+    return jsonify(
+        {
+            "meeting_id": meeting_id,
+            "status": "queued",
+            "status_url": url_for("meeting_status", meeting_id=meeting_id),
+        }
+    ), 202
+
+
+@app.route("/status/<meeting_id>", methods=["GET"])
+def meeting_status(meeting_id):
+    """
+    State of a /process or /process_batch job. Once "done" the response carries the same
+    fields /process used to return synchronously. A job whose status has
+    not moved for MEETING_JOB_STALE_SECONDS is reported as an error.
+    """
+    try:
+        status = read_meeting_status(meeting_id)
+    except ValueError:
+        abort(404)
+    if status is None:
+        return jsonify({"error": "Unknown meeting_id."}), 404
+
+    if status["status"] in ("queued", "processing"):
+        if time.time() - status.get("updated_at", time.time()) > MEETING_JOB_STALE_SECONDS:
+            # Nothing will ever finish this job; don't leave clients polling
+            return jsonify({**status, "status": "error", "error": "Processing was interrupted. Please try again."})
+    if status["status"] != "done":
+        return jsonify(status)
+    try:
+        data = load_meeting_artifacts(meeting_id)
+    except FileNotFoundError:
+        return jsonify({"error": "Unknown meeting_id."}), 404
+    return jsonify({**meeting_result(data), **status, **_meeting_urls(meeting_id)})
+
+
+@app.route("/meeting/<meeting_id>/localized", methods=["GET"])
+def meeting_localized(meeting_id):
+    """
+    Summary + action items in the meeting's original language. "pending"
+    stays true until the background back-translation has been saved.
+    """
+    try:
+        data = load_meeting_artifacts(meeting_id)
+    except (ValueError, FileNotFoundError):
+        abort(404)
+
+    localized = data.get("localized")
+    if localized:
+        return jsonify({"meeting_id": meeting_id, "pending": False, **localized})
+    return jsonify(
+        {
+            "meeting_id": meeting_id,
+            "pending": bool(data.get("localization_pending")),
+            "language": data.get("original_language") or "English",
+            "summary": data.get("summary") or "",
+            "action_items": data.get("action_items") or [],
+        }
+    )
+
+
+@app.route("/process_stream", methods=["POST"])
+def process_stream():
+    """
+    Synchronous variant of /process for a raw application/octet-stream
+    body, bypassing the multipart parser. Filename and agenda come from
+    the query string (?filename=...&agenda=...). The body is copied to an
+    unnamed temp file in 64 KB chunks, so memory stays flat however large
+    the upload is.
+    """
+    filename = secure_filename(request.args.get("filename", ""))
+    if not filename:
+        return jsonify({"error": "No filename given."}), 400
+    agenda = request.args.get("agenda", "").strip()
+
+    with tempfile.TemporaryFile() as tmp:
+        digest = spool_and_hash(request.stream, tmp)
+        meeting_id = new_meeting_id()
+        try:
+            result = _process_audio(meeting_id, filename, tmp, request.mimetype, agenda, digest)
+        except Exception as e:
+            logger.exception("Error processing the audio file")
+            return jsonify({"error": f"Error processing the audio file: {e}"}), 500
+    return jsonify({**result, **_meeting_urls(meeting_id)})
+
+
+def meeting_result(data: dict) -> dict:
+    """The fields /process used to return synchronously, from a meeting's stored artifacts."""
+    localized = data.get("localized") or {}
+    return {
+        "meeting_id": data.get("meeting_id"),
+        "transcript": data.get("original_transcript") or data.get("transcript") or "",
+        "english_transcript": data.get("transcript") or "",
+        "summary": localized.get("summary") or data.get("summary") or "",
+        "english_summary": data.get("summary") or "",
+        "action_items": localized.get("action_items") or data.get("action_items") or [],
+        "english_action_items": data.get("action_items") or [],
+        "original_summary_pending": bool(data.get("localization_pending")),
+        "original_language": data.get("original_language") or "English",
+        "was_translated": bool(data.get("was_translated")),
+        "memo_json": data.get("memo") or {},
+    }
+
+
+def _meeting_urls(meeting_id: str) -> dict:
+    return {
+        "download_url": url_for("download_pdf", meeting_id=meeting_id),
+        "discard_url": url_for("discard_meeting", meeting_id=meeting_id),
+        "transcript_url": url_for("download_transcript", meeting_id=meeting_id),
+        "localized_url": url_for("meeting_localized", meeting_id=meeting_id),
+    }
+
+
+def _localize_meeting(meeting_id: str, language: str, summary: str, action_items: list) -> None:
+    """Translate a meeting's summary + action items back to its language and store them."""
+    try:
+        # The two translations are independent, so they overlap
+        summary_future = executor.submit(translate_summary, summary, language)
+        action_items_future = executor.submit(translate_action_items, action_items, language)
+        save_localized_artifacts(meeting_id, language, summary_future.result(), action_items_future.result())
+        logger.info("Saved %s summary for meeting %s", language, meeting_id)
+    except Exception:
+        logger.exception("Error localizing meeting %s", meeting_id)
+
+
+def _run_process_job(meeting_id: str, filename: str, fileobj, mimetype: str, agenda: str, digest: str) -> None:
+    """Background body of /process; records the outcome as the meeting's status."""
     try:
-        transcript_text, source_language = transcribe_audio_file(save_path)
+        write_meeting_status(meeting_id, "processing")
+        _process_audio(meeting_id, filename, fileobj, mimetype, agenda, digest)
+        # /status answers from the stored meeting; without it there is no result
+        try:
+            _meeting_version(meeting_id)
+        except FileNotFoundError:
+            raise RuntimeError("the meeting could not be saved") from None
+        write_meeting_status(meeting_id, "done")
     except Exception as e:
         logger.exception("Error processing the audio file")
-        return jsonify({"error": f"Error processing the audio file: {e}"}), 500
+        try:
+            write_meeting_status(meeting_id, "error", error=f"Error processing the audio file: {e}")
+        except Exception:
+            logger.exception("Error saving status for meeting %s", meeting_id)
+    finally:
+        fileobj.close()
+
+
+def _process_audio(meeting_id: str, filename: str, fileobj, mimetype: str, agenda: str, digest: str = "") -> dict:
+    """
+    Transcribe, translate, summarize and persist one upload; returns the
+    response fields. Raises if the audio cannot be transcribed.
+    """
+    # Transcribe
+    transcript_text, source_language = transcribe_with_cache(filename, fileobj, mimetype, digest)
 
     # Store the original (untranslated) transcript
     original_transcript = transcript_text
@@ -527,76 +1850,22 @@ def process():
     if was_translated:
         logger.info("Transcript translated from %s to English", detected_language)
 
-    # Save original transcript as .txt
-    base, _ = os.path.splitext(filename)
-    transcript_filename = f"{base}.txt"
-    transcript_path = os.path.join(TRANSCRIPT_FOLDER, transcript_filename)
-    try:
-        with open(transcript_path, "w", encoding="utf-8") as f:
-            # Save the translated version in the transcript file
-            f.write(translated_transcript)
-        logger.info("Saved transcript to: %s", os.path.abspath(transcript_path))
-    except Exception:
-        logger.exception("Error saving transcript")
-        transcript_filename = ""
-
     # Summarize (with agenda if provided, using English/translated transcript for better accuracy)
     try:
         summary, action_items, memo_json = summarize_and_extract_actions(translated_transcript, agenda, detected_language)
     except Exception:
         logger.exception("Error summarizing transcript")
-        summary, action_items = "", []
-
-    # Generate original language version if not English
-    original_summary = summary
-    original_action_items = action_items
-    if was_translated and detected_language and detected_language.lower() != "english":
-        try:
-            translate_prompt = f"""Translate this meeting summary to {detected_language}. Keep the structure and meaning intact. Only provide the translated text.
-
-Summary:
-{summary}"""
-            translate_response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": translate_prompt}],
-                max_tokens=2048,
-            )
-            original_summary = translate_response.choices[0].message.content.strip()
-            logger.info("Translated summary to %s", detected_language)
-        except Exception as e:
-            logger.warning("Could not translate summary to %s: %s", detected_language, e)
-            original_summary = summary  # Fallback to English
-        
-        # Translate action items
-        try:
-            action_items_text = "\n".join(action_items)
-            action_items_prompt = f"""Translate these action items to {detected_language}. Keep the structure and meaning intact. Return as a numbered list.
+        summary, action_items, memo_json = "", [], {}
 
-Action Items:
-{action_items_text}"""
-            action_items_response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": action_items_prompt}],
-                max_tokens=1024,
-            )
-            translated_items_text = action_items_response.choices[0].message.content.strip()
-            # Parse the translated items back into a list
-            original_action_items = [item.strip() for item in translated_items_text.split('\n') if item.strip()]
-            logger.info("Translated action items to %s", detected_language)
-        except Exception as e:
-            logger.warning("Could not translate action items to %s: %s", detected_language, e)
-            original_action_items = action_items  # Fallback to English
+    # The original-language version of the summary is produced in the
+    # background once the artifacts exist; until then the response carries
+    # the English text with original_summary_pending set.
+    back_translate = bool(was_translated and detected_language and detected_language.lower() != "english")
 
-    # Save canonical meeting artifact JSON
-    meeting_id = new_meeting_id()
-    # Save the raw memo JSON (for debugging / inspection)
-    try:
-        memo_path = os.path.join(TRANSCRIPT_FOLDER, f"{meeting_id}_memo.json")
-        with open(memo_path, "w", encoding="utf-8") as f:
-            json.dump(memo_json, f, ensure_ascii=False, indent=2)
-        logger.info("Saved memo JSON to: %s", os.path.abspath(memo_path))
-    except Exception:
-        logger.exception("Error saving memo JSON")
+    # Save the canonical meeting artifact JSON, memo included, in one write.
+    # It is also the transcript's only copy on disk; /transcript/<meeting_id>.txt
+    # renders it as text on demand.
+    artifacts_saved = False
     try:
         save_meeting_artifacts(
             meeting_id=meeting_id,
@@ -606,55 +1875,256 @@ Action Items:
             action_items=action_items,
             original_language=detected_language,
             was_translated=was_translated,
+            localization_pending=back_translate,
+            memo_json=memo_json,
+            original_transcript=original_transcript,
+        )
+        artifacts_saved = True
+        logger.info("Saved meeting artifacts: %s", meeting_id)
+    except Exception:
+        logger.exception("Error saving meeting artifacts")
+
+    original_summary = summary
+    original_action_items = action_items
+    pending = back_translate and artifacts_saved
+    if pending:
+        job_executor.submit(_localize_meeting, meeting_id, detected_language, summary, action_items)
+    elif back_translate:
+        # Nowhere to store a later translation; do it now
+        summary_future = executor.submit(translate_summary, summary, detected_language)
+        original_action_items = translate_action_items(action_items, detected_language)
+        original_summary = summary_future.result()
+
+    return {
+        "meeting_id": meeting_id,
+        "transcript": original_transcript,
+        "english_transcript": translated_transcript,
+        "summary": original_summary,
+        "english_summary": summary,
+        "action_items": original_action_items,
+        "english_action_items": action_items,
+        "original_summary_pending": pending,
+        "original_language": detected_language,
+        "was_translated": was_translated,
+        "memo_json": memo_json,
+    }
+
+
+def _apply_batch_result(meeting_id: str, body) -> None:
+    """Fill in a batch-summarized meeting, unless it was discarded or has expired."""
+    if body is None:
+        logger.warning("No batch summary for meeting %s", meeting_id)
+        return
+    try:
+        meeting = load_meeting_artifacts(meeting_id)
+    except (ValueError, FileNotFoundError):
+        logger.info("Meeting %s is gone; dropping its batch summary", meeting_id)
+        return
+    choice = body["choices"][0]
+    if choice.get("finish_reason") == "length":
+        logger.warning("Batch memo for meeting %s was cut off", meeting_id)
+        return
+    content = (choice["message"]["content"] or "").strip()
+    data = orjson.loads(content) if content else {}
+    summary, action_items = memo_to_summary_and_actions(data)
+    if update_meeting_payload(meeting_id, {**meeting, "summary": summary, "action_items": action_items, "memo": data}):
+        logger.info("Saved batch summary for meeting %s", meeting_id)
+
+
+# Live watcher thread per batch in this process
+_batch_watchers: dict[str, threading.Thread] = {}
+_batch_watchers_lock = threading.Lock()
+
+
+def _forget_batch(batch_id: str) -> None:
+    with _meetings_db_lock:
+        _meetings_conn().execute("DELETE FROM batches WHERE id = ?", (batch_id,))
+    with _batch_watchers_lock:
+        _batch_watchers.pop(batch_id, None)
+
+
+def watch_meeting_batch(batch_id: str, record: bool = True) -> None:
+    """
+    Wait for a submitted batch in the background, unless this process is
+    already watching it. The batch stays recorded in the meetings database
+    until its results are saved, so a worker restart doesn't lose it.
+    """
+    if record:
+        with _meetings_db_lock:
+            _meetings_conn().execute(
+                "INSERT OR IGNORE INTO batches (id, expires_at) VALUES (?, ?)",
+                (batch_id, int(time.time()) + BATCH_MEETING_RETENTION_SECONDS),
+            )
+    with _batch_watchers_lock:
+        watcher = _batch_watchers.get(batch_id)
+        if watcher is not None and watcher.is_alive():
+            return
+        _batch_watchers[batch_id] = batch.watch_batch(
+            _client(), batch_id, _apply_batch_result, on_done=lambda: _forget_batch(batch_id)
         )
-        logger.info("Saved meeting artifacts JSON: %s", os.path.abspath(meeting_json_path(meeting_id)))
+
+
+def resume_batch_watchers() -> None:
+    """
+    Watch every recorded batch this process isn't watching: ones submitted
+    by a worker that has since exited, or whose polling failed. Results are
+    applied idempotently, so a batch also watched by its own worker is harmless.
+    """
+    with _meetings_db_lock:
+        batch_ids = [row[0] for row in _meetings_conn().execute("SELECT id FROM batches")]
+    for batch_id in batch_ids:
+        watch_meeting_batch(batch_id, record=False)
+
+
+def _run_batch_job(uploads: list[tuple[str, str, object, str, str]], agenda: str) -> None:
+    """
+    Background body of /process_batch: transcribe each upload in turn, save
+    it with an empty summary, then submit all their memo requests as one
+    batch. A file that fails is reported on its own status and left out.
+    """
+    requests_by_id: dict[str, dict] = {}
+    try:
+        for i, (meeting_id, filename, fileobj, mimetype, digest) in enumerate(uploads):
+            # Files still waiting their turn mustn't look like an abandoned job
+            for later_id, *_ in uploads[i + 1:]:
+                write_meeting_status(later_id, "queued")
+            try:
+                write_meeting_status(meeting_id, "processing")
+                transcript_text, source_language = transcribe_with_cache(filename, fileobj, mimetype, digest)
+                translated_transcript, detected_language, was_translated = detect_and_translate_if_needed(transcript_text, source_language)
+                # Same map-reduce as the interactive path, so the memo request fits
+                # the context window; the chunk calls themselves aren't batched
+                memo_input = condense_long_transcript(translated_transcript)
+                save_meeting_artifacts(
+                    meeting_id=meeting_id,
+                    filename=filename,
+                    transcript=translated_transcript,
+                    summary="",
+                    action_items=[],
+                    original_language=detected_language,
+                    was_translated=was_translated,
+                    retention_seconds=BATCH_MEETING_RETENTION_SECONDS,
+                )
+                requests_by_id[meeting_id] = build_memo_request(memo_input, agenda)
+            except Exception as e:
+                logger.exception("Error processing the audio file %s", filename)
+                write_meeting_status(meeting_id, "error", error=f"Error processing the audio file {filename}: {e}")
+            finally:
+                fileobj.close()
+
+        if not requests_by_id:
+            return
+        try:
+            batch_id = batch.submit_batch(_client(), requests_by_id)
+        except Exception as e:
+            logger.exception("Error submitting batch")
+            # Nothing will ever fill these in
+            for meeting_id in requests_by_id:
+                delete_meeting_artifacts(meeting_id)
+                write_meeting_status(meeting_id, "error", error=f"Error submitting batch: {e}")
+            return
+
+        watch_meeting_batch(batch_id)
+        for meeting_id in requests_by_id:
+            write_meeting_status(meeting_id, "submitted", batch_id=batch_id)
     except Exception:
-        logger.exception("Error saving meeting artifacts JSON")
+        logger.exception("Error running batch job")
+    finally:
+        for _, _, fileobj, _, _ in uploads:
+            fileobj.close()
+
+
+@app.route("/process_batch", methods=["POST"])
+def process_batch():
+    """
+    Queue several recordings for summarization through the OpenAI Batch API.
+
+    Returns at once with a meeting_id per file. In the background each file
+    is transcribed and saved with an empty summary, and its /status becomes
+    "submitted" once the batch is sent; the summary and action items are
+    filled in when the batch completes (up to 24h, at half the synchronous
+    cost).
+    """
+    files = [f for f in request.files.getlist("audio_files") if f.filename]
+    if not files:
+        return jsonify({"error": "No files selected."}), 400
 
-    # Optionally delete the audio file after processing
+    agenda = request.form.get("agenda", "").strip()
+
+    # The request's upload files are closed when the request ends, so the
+    # job gets its own copies.
+    uploads: list[tuple[str, str, object, str, str]] = []
     try:
-        os.remove(save_path)
-        logger.info("Deleted audio file: %s", save_path)
-    except Exception as e:
-        logger.warning("Could not delete audio file %s: %s", save_path, e)
+        for file in files:
+            filename = secure_filename(file.filename)
+            if app.config["SAVE_UPLOADS"]:
+                save_upload_copy(file, filename)
+            tmp = tempfile.TemporaryFile()
+            try:
+                digest = spool_and_hash(file.stream, tmp)
+            except Exception:
+                tmp.close()
+                raise
+            meeting_id = new_meeting_id()
+            while any(meeting_id == u[0] for u in uploads):  # ids have millisecond resolution
+                meeting_id = new_meeting_id()
+            uploads.append((meeting_id, filename, tmp, file.mimetype, digest))
+        for meeting_id, *_ in uploads:
+            write_meeting_status(meeting_id, "queued")
+        job_executor.submit(_run_batch_job, uploads, agenda)
+    except Exception:
+        for _, _, tmp, _, _ in uploads:
+            tmp.close()
+        raise
 
     return jsonify(
         {
-            "meeting_id": meeting_id,
-            "transcript": original_transcript,
-            "english_transcript": translated_transcript,
-            "summary": original_summary,
-            "english_summary": summary,
-            "action_items": original_action_items,
-            "english_action_items": action_items,
-            "transcript_file": transcript_filename,
-            "original_language": detected_language,
-            "was_translated": was_translated,
-            "download_url": url_for("download_pdf", meeting_id=meeting_id),
-            "discard_url": url_for("discard_meeting", meeting_id=meeting_id),
-            "memo_json": memo_json,
+            "status": "queued",
+            "meetings": [
+                {
+                    "meeting_id": meeting_id,
+                    "source_filename": filename,
+                    "status_url": url_for("meeting_status", meeting_id=meeting_id),
+                    "download_url": url_for("download_pdf", meeting_id=meeting_id),
+                }
+                for meeting_id, filename, _, _, _ in uploads
+            ],
         }
-    )
+    ), 202
 
 
 @app.route("/download/<meeting_id>", methods=["GET"])
 def download_pdf(meeting_id):
     try:
-        data = load_meeting_artifacts(meeting_id)
+        pdf_stream = meeting_pdf_stream(meeting_id)
     except (ValueError, FileNotFoundError):
         abort(404)
 
-    pdf_bytes = build_pdf_bytes(data)
     filename = f"{meeting_id}_meeting_report.pdf"
 
     return send_file(
-        BytesIO(pdf_bytes),
+        pdf_stream,
         mimetype="application/pdf",
         as_attachment=True,
         download_name=filename,
     )
 
 
+@app.route("/transcript/<meeting_id>.txt", methods=["GET"])
+def download_transcript(meeting_id):
+    """Plain-text transcript, rendered from the meeting artifacts on request."""
+    try:
+        data = load_meeting_artifacts(meeting_id)
+    except (ValueError, FileNotFoundError):
+        abort(404)
+
+    return Response(
+        data.get("transcript") or "",
+        mimetype="text/plain",
+        headers={"Content-Disposition": f'inline; filename="{meeting_id}_transcript.txt"'},
+    )
+
+
 @app.route("/discard/<meeting_id>", methods=["POST"])
 def discard_meeting(meeting_id):
     try:
@@ -669,14 +2139,44 @@ def discard_meeting(meeting_id):
 def open_transcripts():
     """On macOS, open the transcripts folder in Finder."""
     folder = os.path.abspath(TRANSCRIPT_FOLDER)
+    if sys.platform != "darwin":
+        return jsonify({"error": "Opening the transcripts folder is only supported on macOS.", "path": folder}), 501
+    import subprocess  # only this macOS-only route spawns processes
+
     try:
-        subprocess.run(["open", folder], check=True)
+        # Fire and forget: don't hold the worker while Finder launches
+        subprocess.Popen(
+            ["open", folder],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            start_new_session=True,
+        )
         return jsonify({"status": "ok"})
     except Exception as e:
         logger.warning("Could not open transcripts folder: %s", e)
         return jsonify({"error": "Could not open transcripts folder."}), 500
 
 
+# Context sent with each /detect_questions call. The browser polls with the
+# whole live transcript, so without a cap every call costs more than the last.
+QUESTION_CONTEXT_MAX_TOKENS = 4000
+
+
+def _transcript_tail(text: str, max_tokens: int) -> str:
+    """The most recent max_tokens tokens of text."""
+    if len(text.encode("utf-8")) <= max_tokens:
+        return text
+    # A token rarely spans more than a few characters; only encode the end
+    tail = text[-max_tokens * 8:]
+    enc = _token_encoding()
+    tokens = enc.encode(tail)
+    if len(tokens) <= max_tokens:
+        return tail
+    return enc.decode(tokens[-max_tokens:])
+
+
 @app.route("/detect_questions", methods=["POST"])
 def detect_questions():
     """
@@ -690,6 +2190,8 @@ def detect_questions():
         if not new_transcript or len(new_transcript) < 20:
             return jsonify({"questions": []})
 
+        full_transcript = _transcript_tail(full_transcript, QUESTION_CONTEXT_MAX_TOKENS)
+
         logger.info("Detecting questions in %d char transcript snippet", len(new_transcript))
 
         # Use GPT to detect questions and determine if rhetorical
@@ -719,11 +2221,11 @@ If no questions are found, return an empty array: []
 New transcript snippet:
 \"\"\"{new_transcript}\"\"\"
 
-Full transcript context:
+Full transcript context (most recent part):
 \"\"\"{full_transcript}\"\"\"
 """
 
-        response = client.chat.completions.create(
+        response = _client().chat.completions.create(
             model="gpt-4o-mini",
             messages=[
                 {"role": "user", "content": detection_prompt}
@@ -735,10 +2237,10 @@ Full transcript context:
         response_text = (response.choices[0].message.content or "").strip()
         
         try:
-            questions = json.loads(response_text)
+            questions = orjson.loads(response_text)
             if not isinstance(questions, list):
                 questions = []
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.warning("Failed to parse question detection response: %s", response_text)
             questions = []
 
@@ -771,7 +2273,7 @@ def translate_content():
 Summary:
 {summary}"""
         
-        summary_response = client.chat.completions.create(
+        summary_response = _long_output_client().chat.completions.create(
             model="gpt-4o-mini",
             messages=[{"role": "user", "content": summary_prompt}],
             max_tokens=2048,
@@ -784,7 +2286,7 @@ Summary:
 Transcript:
 {transcript}"""
         
-        transcript_response = client.chat.completions.create(
+        transcript_response = _long_output_client().chat.completions.create(
             model="gpt-4o-mini",
             messages=[{"role": "user", "content": transcript_prompt}],
             max_tokens=4096,
@@ -805,7 +2307,6 @@ Transcript:
 # Main
 # ----------------------------
 if __name__ == "__main__":
-    if not os.environ.get("OPENAI_API_KEY"):
-        logger.warning("WARNING: OPENAI_API_KEY is not set in the environment.")
-    # Allow connections from local network (iPhone/iPad on same WiFi)
-    app.run(host="0.0.0.0", port=8000, debug=True)
+    # The Werkzeug dev server handles one upload at a time and debug=True
+    # enables the reloader/debugger; serve through gunicorn.conf.py instead.
+    raise SystemExit("Run via gunicorn: gunicorn app:app")
@@ -0,0 +1,119 @@
+"""
+OpenAI Batch API helpers for non-interactive summarization.
+
+Batch requests are billed at half the synchronous price and draw from a
+separate rate-limit pool, at the cost of a completion window of up to
+24 hours. Used by /process_batch for queued uploads and reprocessing.
+"""
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+
+POLL_INTERVAL_SECONDS = 30
+MAX_POLL_INTERVAL_SECONDS = 10 * 60
+POLL_BACKOFF = 1.5
+
+_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def build_batch_jsonl(requests: dict[str, dict]) -> bytes:
+    """Serialize {custom_id: chat completion body} as Batch API JSONL."""
+    lines = [
+        orjson.dumps({"custom_id": custom_id, "method": "POST", "url": BATCH_ENDPOINT, "body": body})
+        for custom_id, body in requests.items()
+    ]
+    return b"\n".join(lines) + b"\n"
+
+
+def submit_batch(client, requests: dict[str, dict]) -> str:
+    """
+    Upload the requests as a batch input file and create the batch.
+
+    Returns:
+        batch_id
+    """
+    input_file = client.files.create(
+        file=("batch_input.jsonl", build_batch_jsonl(requests), "application/jsonl"),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window=BATCH_COMPLETION_WINDOW,
+    )
+    logger.info("Submitted batch %s with %d requests", batch.id, len(requests))
+    return batch.id
+
+
+def wait_for_batch(client, batch_id: str):
+    """Poll until the batch reaches a terminal status, backing off between polls."""
+    interval = POLL_INTERVAL_SECONDS
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status in _TERMINAL_STATUSES:
+            logger.info("Batch %s finished with status: %s", batch_id, batch.status)
+            return batch
+        time.sleep(interval)
+        interval = min(interval * POLL_BACKOFF, MAX_POLL_INTERVAL_SECONDS)
+
+
+def download_batch_results(client, batch) -> dict[str, Optional[dict]]:
+    """
+    Returns:
+        {custom_id: chat completion response body, or None if that request failed}
+    """
+    results: dict[str, Optional[dict]] = {}
+    if not batch.output_file_id:
+        return results
+
+    content = client.files.content(batch.output_file_id).text
+    for line in content.splitlines():
+        if not line.strip():
+            continue
+        record = orjson.loads(line)
+        response = record.get("response") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            logger.warning("Batch request %s failed: %s", record.get("custom_id"), record.get("error") or response)
+            results[record["custom_id"]] = None
+        else:
+            results[record["custom_id"]] = response.get("body")
+    return results
+
+
+def watch_batch(
+    client,
+    batch_id: str,
+    on_result: Callable[[str, Optional[dict]], None],
+    on_done: Optional[Callable[[], None]] = None,
+) -> threading.Thread:
+    """
+    Wait for a batch in a daemon thread and call on_result(custom_id, body)
+    for every request in it, then on_done(). on_done is not called if
+    polling or downloading fails, so the batch can be watched again later.
+    """
+    def _run():
+        try:
+            batch = wait_for_batch(client, batch_id)
+            results = download_batch_results(client, batch)
+        except Exception as e:
+            logger.exception("Polling batch %s failed: %s", batch_id, e)
+            return
+        for custom_id, body in results.items():
+            try:
+                on_result(custom_id, body)
+            except Exception as e:
+                logger.exception("Handling batch result %s failed: %s", custom_id, e)
+        if on_done is not None:
+            on_done()
+
+    t = threading.Thread(target=_run, name=f"batch-{batch_id}", daemon=True)
+    t.start()
+    return t
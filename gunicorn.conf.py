@@ -0,0 +1,31 @@
+"""
+Gunicorn settings. Start the app with:
+
+    gunicorn app:app
+
+gevent workers let each process hold many concurrent uploads while they
+wait on Whisper / GPT instead of one request per worker.
+"""
+import logging
+import os
+
+# Allow connections from local network (iPhone/iPad on same WiFi)
+bind = "0.0.0.0:8000"
+
+worker_class = "gevent"
+workers = (2 * (os.cpu_count() or 1)) + 1
+worker_connections = 100
+timeout = 120
+
+
+def on_starting(server):
+    if not os.environ.get("OPENAI_API_KEY"):
+        logging.getLogger("gunicorn.error").warning("WARNING: OPENAI_API_KEY is not set in the environment.")
+
+
+def post_worker_init(worker):
+    # After the app is loaded (and, for gevent, after monkey-patching), so
+    # the janitor thread is created the same way request threads are
+    import app
+
+    app.start_janitor()
@@ -62,6 +62,7 @@ let currentAgenda = "";
 
 // Store original and translated content
 let currentMeetingData = {
+  meetingId: "",
   originalLanguage: "English",
   originalSummary: "",
   originalTranscript: "",
@@ -156,6 +157,7 @@ function resetUI() {
   actionItemsList.innerHTML = "";
   transcriptText.textContent = "";
   transcriptFileInfo.textContent = "";
+  currentMeetingData.meetingId = "";
   // Hide post actions
   if (postActions) postActions.style.display = "none";
   if (downloadPdfBtn) downloadPdfBtn.href = "#";
@@ -194,6 +196,76 @@ uploadForm.addEventListener("submit", async (event) => {
   await processFormData(formData, "Uploading file…", "Transcribing audio…");
 });
 
+// ---- Poll a queued /process job until it finishes ----
+
+const STATUS_POLL_INTERVAL_MS = 1500;
+
+// A job can legitimately take minutes (long uploads, retried API calls);
+// the server only reports a job whose worker died after half an hour
+const STATUS_POLL_DEADLINE_MS = 15 * 60 * 1000;
+
+async function pollMeetingStatus(statusUrl, processingLabel) {
+  const deadline = Date.now() + STATUS_POLL_DEADLINE_MS;
+  while (Date.now() < deadline) {
+    await new Promise((resolve) => setTimeout(resolve, STATUS_POLL_INTERVAL_MS));
+
+    const resp = await fetch(statusUrl);
+    if (!resp.ok) {
+      throw new Error(`Server error: ${resp.status}`);
+    }
+    const status = await resp.json();
+
+    if (status.status === "done" || status.status === "error") {
+      return status;
+    }
+    if (status.status === "processing") {
+      setProgress(60, processingLabel);
+    }
+  }
+  return { status: "error", error: "Processing is taking too long. Please try again." };
+}
+
+// ---- Original-language summary, translated after the job finishes ----
+
+const LOCALIZED_POLL_MAX_ATTEMPTS = 40;
+
+function renderActionItems(items) {
+  actionItemsList.innerHTML = "";
+  if (Array.isArray(items) && items.length > 0) {
+    items.forEach((item) => {
+      const li = document.createElement("li");
+      li.textContent = item;
+      actionItemsList.appendChild(li);
+    });
+  } else {
+    const li = document.createElement("li");
+    li.textContent = "(No action items found)";
+    actionItemsList.appendChild(li);
+  }
+}
+
+async function pollLocalized(meetingId, localizedUrl) {
+  for (let attempt = 0; attempt < LOCALIZED_POLL_MAX_ATTEMPTS; attempt++) {
+    await new Promise((resolve) => setTimeout(resolve, STATUS_POLL_INTERVAL_MS));
+    // A newer meeting replaced this one on screen
+    if (currentMeetingData.meetingId !== meetingId) return;
+
+    const resp = await fetch(localizedUrl);
+    if (!resp.ok) return;
+    const localized = await resp.json();
+    if (localized.pending) continue;
+
+    if (currentMeetingData.meetingId !== meetingId) return;
+    currentMeetingData.originalSummary = localized.summary || currentMeetingData.originalSummary;
+    currentMeetingData.actionItems = localized.action_items || currentMeetingData.actionItems;
+    if (currentMeetingData.currentDisplayLanguage === currentMeetingData.originalLanguage) {
+      summaryText.textContent = currentMeetingData.originalSummary;
+      renderActionItems(currentMeetingData.actionItems);
+    }
+    return;
+  }
+}
+
 // ---- Process FormData (shared by upload + live recording) ----
 
 async function processFormData(formData, initialLabel = "Processing…", transcribingLabel = "Transcribing…") {
@@ -225,19 +297,22 @@ async function processFormData(formData, initialLabel = "Processing…", transcr
       return;
     }
 
-    setProgress(60, transcribingLabel);
-
-    const data = await response.json();
-
-    setProgress(100, "Done");
-    progressSection.style.display = "block";
+    // /process queues the job; poll until the result is ready
+    const job = await response.json();
+    setProgress(20, transcribingLabel);
+    const data = await pollMeetingStatus(job.status_url, transcribingLabel);
 
     if (data.error) {
+      setProgress(0, "Error");
       showError(data.error);
       return;
     }
 
+    setProgress(100, "Done");
+    progressSection.style.display = "block";
+
     // Store the meeting data
+    currentMeetingData.meetingId = data.meeting_id || "";
     currentMeetingData.originalLanguage = data.original_language || "English";
     currentMeetingData.originalSummary = data.summary || "(No summary returned)";
     currentMeetingData.originalTranscript = data.transcript || "(No transcript)";
@@ -267,23 +342,22 @@ async function processFormData(formData, initialLabel = "Processing…", transcr
     summaryText.textContent = currentMeetingData.originalSummary;
     transcriptText.textContent = currentMeetingData.originalTranscript;
 
-    actionItemsList.innerHTML = "";
-    if (Array.isArray(currentMeetingData.actionItems) && currentMeetingData.actionItems.length > 0) {
-      currentMeetingData.actionItems.forEach((item) => {
-        const li = document.createElement("li");
-        li.textContent = item;
-        actionItemsList.appendChild(li);
-      });
-    } else {
-      const li = document.createElement("li");
-      li.textContent = "(No action items found)";
-      actionItemsList.appendChild(li);
+    renderActionItems(currentMeetingData.actionItems);
+
+    // The summary shown so far is English; swap in the original-language
+    // version once its background translation is saved.
+    if (data.original_summary_pending && data.localized_url) {
+      pollLocalized(currentMeetingData.meetingId, data.localized_url);
     }
 
-    if (data.transcript_file) {
-      transcriptFileInfo.textContent = `Transcript saved as: ${data.transcript_file}`;
-    } else {
-      transcriptFileInfo.textContent = "";
+    // The transcript is stored with the meeting; offer it as a download
+    transcriptFileInfo.textContent = "";
+    if (data.transcript_url) {
+      const link = document.createElement("a");
+      link.href = data.transcript_url;
+      link.target = "_blank";
+      link.textContent = "Download transcript (.txt)";
+      transcriptFileInfo.appendChild(link);
     }
 
     // ---- NEW: Post-processing buttons (Download PDF + Discard) ----
@@ -348,6 +422,7 @@ let detectedQuestions = []; // Array of {question, answer, isRhetorical}
 let lastProcessedTranscriptLength = 0;
 let autoQAPanelCollapsed = false;
 let autoDetectionInterval = null;
+let autoDetectInFlight = false; // one /detect_questions call at a time
 
 function setLiveStatus(message) {
   liveStatus.textContent = message || "";
@@ -407,6 +482,11 @@ autoQAToggle.addEventListener("click", () => {
 });
 
 async function detectAndAnswerQuestions() {
+  if (autoDetectInFlight) {
+    // Still waiting on the last call; new speech goes out with the next tick
+    return;
+  }
+
   const newTranscript = currentLiveTranscript.substring(lastProcessedTranscriptLength);
 
   if (newTranscript.trim().length < 20) {
@@ -417,6 +497,7 @@ async function detectAndAnswerQuestions() {
 
   console.log("Auto-detect: Processing", newTranscript.trim().length, "chars of new transcript");
   lastProcessedTranscriptLength = currentLiveTranscript.length;
+  autoDetectInFlight = true;
 
   try {
     const response = await fetch("/detect_questions", {
@@ -461,6 +542,8 @@ async function detectAndAnswerQuestions() {
     }
   } catch (err) {
     console.error("Auto-detection error:", err);
+  } finally {
+    autoDetectInFlight = false;
   }
 }
 
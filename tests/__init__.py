@@ -0,0 +1,23 @@
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# app creates its folders, log file and meetings database relative to the
+# working directory on import; keep them out of the checkout
+os.chdir(tempfile.mkdtemp(prefix="meeting-assistant-tests-"))
+
+
+class WordEncoding:
+    """
+    Stand-in for the tiktoken encoding (which downloads its BPE ranks on
+    first use): one token per space-separated word.
+    """
+
+    def encode(self, text: str) -> list[str]:
+        return text.split(" ")
+
+    def decode(self, tokens: list[str]) -> str:
+        return " ".join(tokens)
@@ -0,0 +1,76 @@
+import unittest
+from unittest import mock
+
+from tests import WordEncoding
+
+import app
+
+
+def _paragraph(index: int, words: int) -> str:
+    return " ".join(f"p{index}w{i}" for i in range(words)) + "."
+
+
+class ChunkTranscriptTest(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(app, "_token_encoding", return_value=WordEncoding())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.enc = WordEncoding()
+
+    def n_tokens(self, text: str) -> int:
+        return len(self.enc.encode(text))
+
+    def test_short_transcript_is_one_chunk(self):
+        text = _paragraph(0, 10) + "\n\n" + _paragraph(1, 10)
+        self.assertEqual(app.chunk_transcript(text, max_tokens=100, overlap_tokens=20), [text])
+
+    def test_empty_transcript_has_no_chunks(self):
+        self.assertEqual(app.chunk_transcript("", max_tokens=100, overlap_tokens=20), [])
+
+    def test_chunks_stay_within_max_tokens(self):
+        text = "\n\n".join(_paragraph(i, 7 + i % 5) for i in range(60))
+        chunks = app.chunk_transcript(text, max_tokens=40, overlap_tokens=10)
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks:
+            self.assertLessEqual(self.n_tokens(chunk), 40)
+
+    def test_chunks_break_at_paragraphs_and_keep_every_one(self):
+        paragraphs = [_paragraph(i, 8) for i in range(30)]
+        chunks = app.chunk_transcript("\n\n".join(paragraphs), max_tokens=40, overlap_tokens=10)
+        seen = [p for chunk in chunks for p in chunk.split("\n\n")]
+        self.assertEqual(sorted(set(seen)), sorted(paragraphs))
+
+    def test_each_chunk_repeats_the_tail_of_the_previous_one(self):
+        paragraphs = [_paragraph(i, 8) for i in range(30)]
+        chunks = app.chunk_transcript("\n\n".join(paragraphs), max_tokens=40, overlap_tokens=10)
+        for previous, chunk in zip(chunks, chunks[1:]):
+            previous_parts = previous.split("\n\n")
+            parts = chunk.split("\n\n")
+            # 9-token paragraphs: exactly one fits in the 10-token overlap
+            self.assertEqual(parts[0], previous_parts[-1])
+            self.assertNotIn(parts[1], previous_parts)
+
+    def test_overlap_never_exceeds_overlap_tokens(self):
+        paragraphs = [_paragraph(i, 8) for i in range(30)]
+        chunks = app.chunk_transcript("\n\n".join(paragraphs), max_tokens=40, overlap_tokens=5)
+        # No whole paragraph fits in 5 tokens, so nothing is carried over
+        seen = [p for chunk in chunks for p in chunk.split("\n\n")]
+        self.assertEqual(seen, paragraphs)
+
+    def test_oversized_paragraph_falls_back_to_sentences(self):
+        sentences = [_paragraph(i, 9) for i in range(12)]
+        chunks = app.chunk_transcript(" ".join(sentences), max_tokens=30, overlap_tokens=0)
+        self.assertEqual(" ".join(chunks), " ".join(sentences))
+        for chunk in chunks:
+            self.assertLessEqual(self.n_tokens(chunk), 30)
+            self.assertTrue(chunk.endswith("."))
+
+    def test_oversized_sentence_falls_back_to_token_slices(self):
+        sentence = _paragraph(0, 95)
+        chunks = app.chunk_transcript(sentence, max_tokens=30, overlap_tokens=0)
+        self.assertEqual([self.n_tokens(c) for c in chunks], [30, 30, 30, 5])
+        self.assertEqual(" ".join(chunks), sentence)
+
+
+if __name__ == "__main__":
+    unittest.main()
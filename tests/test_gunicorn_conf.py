@@ -0,0 +1,47 @@
+import importlib.util
+import os
+import threading
+import time
+import unittest
+
+from tests import ROOT
+
+import app
+
+
+def _load_gunicorn_conf():
+    # "gunicorn.conf" isn't an importable module name; gunicorn execs the file too
+    spec = importlib.util.spec_from_file_location("gunicorn_conf", os.path.join(ROOT, "gunicorn.conf.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _janitor_threads() -> list[threading.Thread]:
+    return [t for t in threading.enumerate() if t.name == "janitor"]
+
+
+class PostWorkerInitTest(unittest.TestCase):
+    def test_importing_app_does_not_start_the_janitor(self):
+        self.assertEqual(_janitor_threads(), [])
+
+    def test_post_worker_init_starts_a_working_janitor(self):
+        self.assertEqual(_janitor_threads(), [])
+        _load_gunicorn_conf().post_worker_init(None)
+
+        janitors = _janitor_threads()
+        self.assertEqual(len(janitors), 1)
+        self.assertTrue(janitors[0].is_alive())
+        self.assertTrue(janitors[0].daemon)
+
+        # The cache sweep is the last step of a tick, so this only passes
+        # once a whole tick ran without raising
+        deadline = time.monotonic() + 10
+        while app._last_sweep["caches_at"] == 0.0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertNotEqual(app._last_sweep["caches_at"], 0.0, "the first janitor tick did not finish")
+        self.assertTrue(janitors[0].is_alive())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import random
+import re
+import string
+import unittest
+
+import tests  # noqa: F401  (working directory setup)
+
+import app
+
+# The pattern safe_meeting_id used before the character-set check
+OLD_MEETING_ID_RE = re.compile(r"[A-Za-z0-9_-]{6,80}")
+
+
+def _accepted(meeting_id) -> bool:
+    try:
+        return app.safe_meeting_id(meeting_id) == meeting_id
+    except ValueError:
+        return False
+
+
+class SafeMeetingIdTest(unittest.TestCase):
+    def test_new_meeting_ids_are_accepted(self):
+        self.assertTrue(_accepted(app.new_meeting_id()))
+
+    def test_matches_the_old_regex_on_edge_cases(self):
+        cases = [
+            "",
+            "abcde",
+            "abcdef",
+            "a" * 80,
+            "a" * 81,
+            "20260109_104455_123",
+            "20260109_104455_123\n",
+            "\n20260109_104455_123",
+            "../../etc/passwd",
+            "abc def",
+            "abc/def",
+            "abc.def",
+            "abcdéf",
+            "abc\x00def",
+            "ＡＢＣＤＥＦ",  # fullwidth letters: str.isalnum() would accept these
+            "١٢٣٤٥٦",  # Arabic-Indic digits
+            "----__",
+        ]
+        for case in cases:
+            with self.subTest(meeting_id=case):
+                self.assertEqual(_accepted(case), bool(OLD_MEETING_ID_RE.fullmatch(case)))
+
+    def test_matches_the_old_regex_on_random_ids(self):
+        rng = random.Random(0)
+        valid = string.ascii_letters + string.digits + "_-"
+        invalid = "./ \n\té$"
+        for _ in range(5000):
+            # Mostly valid characters, so both outcomes are well covered
+            case = "".join(
+                rng.choice(invalid if rng.random() < 0.01 else valid) for _ in range(rng.randint(0, 90))
+            )
+            with self.subTest(meeting_id=case):
+                self.assertEqual(_accepted(case), bool(OLD_MEETING_ID_RE.fullmatch(case)))
+
+
+if __name__ == "__main__":
+    unittest.main()
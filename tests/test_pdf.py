@@ -0,0 +1,80 @@
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+import tests  # noqa: F401  (working directory setup)
+
+import app
+
+
+class SplitLongBlockTest(unittest.TestCase):
+    def test_short_block_is_kept_whole(self):
+        block = "One. Two. Three."
+        self.assertEqual(app._split_long_block(block, 100), [block])
+
+    def test_pieces_are_whole_sentences_within_max_chars(self):
+        sentences = [f"Sentence number {i} is here." for i in range(200)]
+        pieces = app._split_long_block(" ".join(sentences), 120)
+        self.assertGreater(len(pieces), 1)
+        self.assertEqual(" ".join(pieces), " ".join(sentences))
+        for piece in pieces:
+            self.assertLessEqual(len(piece), 120)
+            self.assertTrue(piece.endswith("."))
+
+    def test_whitespace_inside_a_piece_is_kept(self):
+        block = "First one.  Second one?\tThird one! " + "x" * 40 + "."
+        pieces = app._split_long_block(block, 40)
+        self.assertEqual(pieces[0], "First one.  Second one?\tThird one!")
+
+    def test_sentence_longer_than_max_chars_stays_whole(self):
+        long_sentence = "word " * 100 + "end."
+        pieces = app._split_long_block(f"Short. {long_sentence} Short again.", 50)
+        self.assertEqual(pieces, ["Short.", long_sentence, "Short again."])
+
+    def test_text_without_sentence_ends_is_one_piece(self):
+        block = "no sentence end " * 50
+        self.assertEqual(app._split_long_block(block, 100), [block])
+
+
+def _meeting(i: int) -> dict:
+    return {
+        "meeting_id": f"20260101_000000_{i:03d}",
+        "source_filename": f"meeting-{i}.mp3",
+        "original_language": "English",
+        "summary": f"Summary of meeting {i}.\n\n- Point {i}",
+        "action_items": [f"Item {i}.{n} — Owner {n}" for n in range(i % 4)],
+        "transcript": " ".join(f"Meeting {i} sentence {n}." for n in range(400 + 50 * i)),
+    }
+
+
+def _build(data: dict) -> bytes:
+    out = BytesIO()
+    app.build_pdf_to(data, out)
+    return out.getvalue()
+
+
+class ConcurrentPdfBuildTest(unittest.TestCase):
+    def setUp(self):
+        # Fixed timestamps and document ids, so identical reports are identical bytes
+        from reportlab import rl_config
+
+        self.addCleanup(setattr, rl_config, "invariant", rl_config.invariant)
+        rl_config.invariant = 1
+        # Switch threads very often, so builds interleave mid-draw
+        self.addCleanup(sys.setswitchinterval, sys.getswitchinterval())
+        sys.setswitchinterval(1e-6)
+
+    def test_concurrent_builds_match_serial_builds(self):
+        # The prebuilt title/heading flowables are shared by every build
+        meetings = [_meeting(i) for i in range(8)]
+        expected = [_build(m) for m in meetings]
+        jobs = [i % len(meetings) for i in range(32)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda i: _build(meetings[i]), jobs))
+        for i, result in zip(jobs, results):
+            self.assertEqual(result, expected[i])
+
+
+if __name__ == "__main__":
+    unittest.main()
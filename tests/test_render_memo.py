@@ -0,0 +1,135 @@
+import random
+import unittest
+
+import tests  # noqa: F401  (working directory setup)
+
+import app
+
+
+def list_based_render(data: dict) -> str:
+    """_render_memo_to_text as it was before the StringIO rewrite, kept as the reference output."""
+    title = (data.get("title") or "Meeting Notes").strip()
+    mtype = (data.get("meeting_type") or "other").strip()
+
+    lines: list[str] = []
+
+    # Header
+    lines.append(title)
+    lines.append(f"Type: {mtype}")
+    lines.append("")  # blank line
+
+    def add_section(header: str, items: list[str]):
+        if not items:
+            return
+        lines.append(header)
+        lines.append("")  # space after header
+        for it in items:
+            s = str(it).strip()
+            if s:
+                lines.append(f"- {s}")
+        lines.append("")  # space after section
+
+    # Core sections
+    add_section("Summary", data.get("summary_bullets") or [])
+    add_section("Key Topics", data.get("key_topics") or [])
+    add_section("Decisions", data.get("decisions") or [])
+    add_section("Risks / Blockers", data.get("risks_blockers") or [])
+    add_section("Open Questions", data.get("open_questions") or [])
+
+    # Detailed notes
+    sections = data.get("notes_by_section") or []
+    if sections:
+        lines.append("Details")
+        lines.append("")
+        for sec in sections:
+            if not isinstance(sec, dict):
+                continue
+            heading = (sec.get("heading") or "").strip()
+            bullets = sec.get("bullets") or []
+
+            if heading:
+                lines.append(heading)
+                lines.append("")
+
+            for b in bullets:
+                s = str(b).strip()
+                if s:
+                    lines.append(f"- {s}")
+
+            lines.append("")  # space between detail subsections
+
+    # Trim trailing whitespace
+    while lines and lines[-1] == "":
+        lines.pop()
+
+    return "\n".join(lines)
+
+
+LIST_FIELDS = ("summary_bullets", "key_topics", "decisions", "risks_blockers", "open_questions")
+# Includes the values that stress blank-line handling: empty, whitespace-only
+# and padded strings, and non-strings the renderer str()s
+VALUES = ["Ship Friday", "  padded  ", "", "   ", "\n", "line one\nline two", "trailing\n\n", None, 3]
+
+
+def _random_memo(rng: random.Random) -> dict:
+    memo = {}
+    if rng.random() < 0.8:
+        memo["title"] = rng.choice(["Weekly sync", "  Padded title  ", "", " ", None])
+    if rng.random() < 0.8:
+        memo["meeting_type"] = rng.choice(["standup", "other", "", "  ", None])
+    for field in LIST_FIELDS:
+        if rng.random() < 0.6:
+            memo[field] = [rng.choice(VALUES) for _ in range(rng.randint(0, 3))]
+    if rng.random() < 0.6:
+        sections = []
+        for _ in range(rng.randint(0, 3)):
+            if rng.random() < 0.1:
+                sections.append("not a section")
+                continue
+            section = {}
+            if rng.random() < 0.8:
+                section["heading"] = rng.choice(["Budget", "  Hiring ", "", " ", None])
+            if rng.random() < 0.8:
+                section["bullets"] = [rng.choice(VALUES) for _ in range(rng.randint(0, 3))]
+            sections.append(section)
+        memo["notes_by_section"] = sections
+    return memo
+
+
+class RenderMemoTest(unittest.TestCase):
+    def test_full_memo(self):
+        memo = {
+            "title": "Weekly sync",
+            "meeting_type": "standup",
+            "summary_bullets": ["Release is on track", "QA starts Monday"],
+            "key_topics": ["Release"],
+            "decisions": ["Ship Friday"],
+            "risks_blockers": ["Staging is flaky"],
+            "open_questions": ["Who owns the rollback?"],
+            "notes_by_section": [{"heading": "Release", "bullets": ["Freeze on Thursday"]}],
+        }
+        expected = (
+            "Weekly sync\nType: standup\n\n"
+            "Summary\n\n- Release is on track\n- QA starts Monday\n\n"
+            "Key Topics\n\n- Release\n\n"
+            "Decisions\n\n- Ship Friday\n\n"
+            "Risks / Blockers\n\n- Staging is flaky\n\n"
+            "Open Questions\n\n- Who owns the rollback?\n\n"
+            "Details\n\nRelease\n\n- Freeze on Thursday"
+        )
+        self.assertEqual(app._render_memo_to_text(memo), expected)
+        self.assertEqual(list_based_render(memo), expected)
+
+    def test_empty_memo(self):
+        self.assertEqual(app._render_memo_to_text({}), "Meeting Notes\nType: other")
+
+    def test_matches_the_list_based_renderer(self):
+        rng = random.Random(0)
+        for _ in range(2000):
+            memo = _random_memo(rng)
+            with self.subTest(memo=memo):
+                self.assertEqual(app._render_memo_to_text(memo), list_based_render(memo))
+
+
+if __name__ == "__main__":
+    unittest.main()